@@ -0,0 +1,66 @@
+"""Article content: section layout, prose files and the stylesheet.
+
+Prose lives in ``articles/<STOCK KEY>/<section>.md`` so the Streamlit page and
+the static exporter render the same text. A missing file is an empty section.
+"""
+import html
+import os
+import re
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ARTICLES_DIR = os.path.join(BASE_DIR, "articles")
+STYLESHEET = os.path.join(BASE_DIR, "static", "editorial.css")
+
+ANALYSIS_START = "2024-01-01"
+ANALYSIS_NOTE = "Note: This analysis was written on January 10th, 2026, and may be outdated."
+ANALYSIS_DATE = "January 10, 2026"
+DISCLAIMER = (
+    "This analysis is for educational and informational purposes only. It does not constitute "
+    "financial advice. Please conduct your own research and consult with a qualified financial "
+    "advisor before making investment decisions."
+)
+
+# (prose file, anchor id, heading)
+SECTIONS = [
+    ("overview", "i-stock-overview", "I. Stock Overview"),
+    ("price_action", "ii-price-action-and-technical-analysis", "II. Price Action and Technical Analysis"),
+    ("volume_volatility", "iii-volume-and-volatility-analysis", "III. Volume and Volatility Analysis"),
+    ("returns", "iv-returns-analysis", "IV. Returns Analysis"),
+    ("risk", "v-risk-assessment-and-metrics", "V. Risk Assessment and Metrics"),
+    ("conclusion", "vi-investment-conclusion", "VI. Investment Conclusion"),
+]
+
+
+def article_files(key):
+    return [os.path.join(ARTICLES_DIR, key, f"{name}.md") for name, _, _ in SECTIONS]
+
+
+def load_article(key):
+    """Return ``{section: markdown}`` for the stock ``key``."""
+    article = {}
+    for (name, _, _), path in zip(SECTIONS, article_files(key)):
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                article[name] = f.read()
+        else:
+            article[name] = ""
+    return article
+
+
+def load_stylesheet():
+    with open(STYLESHEET, encoding="utf-8") as f:
+        return f.read()
+
+
+def markdown_to_html(text):
+    """Render the small markdown subset the articles use (paragraphs, bold,
+    italics, links and ``\\$`` escapes) to HTML."""
+    paragraphs = [p.strip() for p in re.split(r"\n\s*\n", text.strip()) if p.strip()]
+    out = []
+    for paragraph in paragraphs:
+        body = html.escape(paragraph.replace("\\$", "$"), quote=False)
+        body = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", body)
+        body = re.sub(r"(?<!\*)\*(?!\s)(.+?)(?<!\s)\*", r"<em>\1</em>", body)
+        body = re.sub(r"\[([^\]]+)\]\(([^)\s]+)\)", r'<a href="\2">\1</a>', body)
+        out.append(f"<p>{body}</p>".replace("\n", " "))
+    return "\n".join(out)
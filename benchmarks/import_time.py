@@ -0,0 +1,88 @@
+"""Import-time budget for the app's cold start.
+
+Runs ``python -X importtime`` over the modules ``finance_blog.py`` imports
+before drawing anything, and over a bare import of the libraries they need
+(``REFERENCE_MODULES``), alternating fresh interpreters. The best app total
+may exceed the best reference total by at most ``MAX_OVERHEAD``, so the
+check holds on any machine. It also fails if a module that should only load
+on demand (yfinance, plotly.express, the Plotly figure classes) is pulled in
+at startup::
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --runs 10
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# What finance_blog.py imports at the top, in order
+STARTUP_MODULES = [
+    "streamlit", "article", "charts", "compact", "dataset", "downsample", "drawdowns", "extremes", "fetch_scheduler",
+    "indicators", "instrumentation", "metrics", "peers", "periodic", "prewarm", "price_store", "risk", "series_cache",
+    "shared_cache", "stock_registry",
+]
+# Must not be imported until a chart is built or something goes upstream
+DEFERRED_MODULES = ["yfinance", "plotly.express", "plotly.graph_objs._figure"]
+# The third-party libraries the startup imports cannot avoid
+REFERENCE_MODULES = ["numpy", "pandas", "streamlit"]
+# The app's own modules may add at most this fraction on top of the reference. They add a
+# few percent today; the rest is room for timing noise. An eager yfinance or Plotly import
+# is caught by the DEFERRED_MODULES check rather than by this budget.
+MAX_OVERHEAD = 0.25
+
+
+def measure(modules=STARTUP_MODULES):
+    """``(total_us, {module: cumulative_us}, deferred modules that got imported)``."""
+    code = (
+        f"import sys; import {', '.join(modules)}; "
+        f"print([m for m in {DEFERRED_MODULES!r} if m in sys.modules])"
+    )
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                          capture_output=True, text=True, check=True)
+    per_module = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            # Top-level entries are not indented; only those add up to the total
+            if name.strip() in modules and name == " " + name.strip():
+                per_module[name.strip()] = int(cumulative)
+    leaked = json.loads(proc.stdout.strip().replace("'", '"'))
+    return sum(per_module.values()), per_module, leaked
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the app's import time against its budget.")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters to time (default %(default)s)")
+    args = parser.parse_args(argv)
+
+    # Alternated, so both sides see the same machine load
+    results, references = [], []
+    for _ in range(args.runs):
+        results.append(measure())
+        references.append(measure(REFERENCE_MODULES)[0])
+    total, per_module, leaked = min(results, key=lambda r: r[0])
+    reference = min(references)
+    print(f"startup imports: {total / 1000:.0f} ms, {', '.join(REFERENCE_MODULES)} alone: "
+          f"{reference / 1000:.0f} ms (best of {args.runs})")
+    for name, us in sorted(per_module.items(), key=lambda kv: -kv[1]):
+        print(f"  {name:<16} {us / 1000:8.1f} ms")
+
+    failed = False
+    if leaked:
+        print(f"FAIL: imported at startup: {', '.join(leaked)}")
+        failed = True
+    budget = reference * (1 + MAX_OVERHEAD)
+    if total > budget:
+        print(f"FAIL: {total / 1000:.0f} ms is over the {budget / 1000:.0f} ms budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
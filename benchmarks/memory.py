@@ -0,0 +1,126 @@
+"""Memory per ticker and the compact schema's precision policy.
+
+Reports the bytes one ticker-year (252 bars) takes as a float64 frame, as the
+compact frame ``PriceStore`` now loads, as a ``CompactSeries``, and as a
+page ``Dataset`` (compact frame plus the float64 indicator block), scaled to
+``--tickers``. It then checks the precision policy on synthetic series at
+price levels from fractions of a cent to BRK-A, and fails if a price moved
+by more than ``compact.PRICE_TOLERANCE`` or a round trip through
+``CompactSeries`` changed anything. Last, each series is written to a
+``PriceStore`` and loaded back (and sent through the shared cache's byte
+encoding): prices must stay within tolerance, and volumes and dates must
+come back exact, including volumes past the uint32 range::
+
+    python benchmarks/memory.py
+    python benchmarks/memory.py --tickers 5000
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from compact import PRICE_COLUMNS, PRICE_TOLERANCE, CompactSeries, compact_columns, memory_report  # noqa: E402
+from dataset import Dataset  # noqa: E402
+from indicators import compute_indicators  # noqa: E402
+from pipeline import synthetic_ohlcv  # noqa: E402
+from price_store import PriceStore, frame_from_bytes, frame_to_bytes  # noqa: E402
+
+BARS_PER_YEAR = 252
+PRICE_LEVELS = (0.0005, 0.05, 1, 20, 400, 9_000, 60_000, 700_000)
+
+
+def footprint(years=1):
+    """Bytes per ticker for ``years`` of daily bars in each representation."""
+    df = synthetic_ohlcv(BARS_PER_YEAR * years)
+    compact = pd.DataFrame(compact_columns(df), index=df.index)
+    series = CompactSeries.from_frame(df)
+    dataset = Dataset(compact, compute_indicators(compact["Close"].to_numpy()))
+    return memory_report({
+        "float64 frame": df,
+        "compact frame": compact,
+        "CompactSeries": series,
+        "page dataset": dataset.frame,
+    })
+
+
+def check_precision(levels=PRICE_LEVELS):
+    """``[(level, dtype, max abs price error, round trip ok)]``."""
+    results = []
+    for level in levels:
+        df = _scaled(level)
+        columns = compact_columns({name: df[name].to_numpy() for name in df.columns})
+        error = max(float(np.max(np.abs(columns[name].astype(np.float64) - df[name].to_numpy())))
+                    for name in PRICE_COLUMNS)
+        series = CompactSeries.from_frame(df)
+        back = series.to_frame()
+        round_trip = back.index.equals(df.index) and all(
+            np.array_equal(back[name].to_numpy(), columns[name]) for name in columns
+        )
+        results.append((level, columns["Close"].dtype, error, round_trip))
+    return results
+
+
+def _scaled(level):
+    df = synthetic_ohlcv(BARS_PER_YEAR * 2, seed=int(level * 1000) % 2**32)
+    df[list(PRICE_COLUMNS)] *= level / df["Close"].iloc[0]
+    return df
+
+
+def check_store_round_trip(levels=PRICE_LEVELS):
+    """``[(level, path, volume dtype, max abs price error, volumes exact, dates exact)]``
+    for a ``PriceStore`` write/load, then a ``frame_to_bytes``/``frame_from_bytes`` trip."""
+    results = []
+    with tempfile.TemporaryDirectory() as root:
+        store = PriceStore(root)
+        for i, level in enumerate(levels):
+            df = _scaled(level)
+            # Every other level trades more shares than uint32 holds
+            df["Volume"] = df["Volume"].astype(np.uint64) * (2**33 if i % 2 else 1)
+            ticker = f"L{i}"
+            store.write(ticker, df)
+            loaded = store.load(ticker)
+            for path, back in (("store", loaded), ("bytes", frame_from_bytes(frame_to_bytes(loaded)))):
+                error = max(float(np.max(np.abs(back[name].to_numpy(np.float64) - df[name].to_numpy())))
+                            for name in PRICE_COLUMNS)
+                volumes = np.array_equal(back["Volume"].to_numpy(np.uint64), df["Volume"].to_numpy())
+                dates = back.index.equals(df.index) and back.index.tz == df.index.tz
+                results.append((level, path, back["Volume"].dtype, error, volumes, dates))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report memory per ticker and check the precision policy.")
+    parser.add_argument("--tickers", type=int, default=1000, help="universe size to scale to (default %(default)s)")
+    parser.add_argument("--years", type=int, default=1, help="years of daily bars per ticker (default %(default)s)")
+    args = parser.parse_args(argv)
+
+    print(f"{args.years} ticker-year(s) of daily bars, scaled to {args.tickers:,} tickers")
+    for row in footprint(args.years):
+        print(f"  {row['ticker']:<14} {row['bytes']:>9,} bytes  {row['bytes_per_bar']:6.1f} B/bar"
+              f"  {row['bytes'] * args.tickers / 2**20:9.1f} MiB")
+
+    failed = False
+    print(f"precision policy (tolerance {PRICE_TOLERANCE})")
+    for level, dtype, error, round_trip in check_precision():
+        ok = error <= PRICE_TOLERANCE and round_trip
+        failed |= not ok
+        print(f"  ${level:<10,} {str(dtype):<8} max error {error:.2e}  round trip {'ok' if round_trip else 'CHANGED'}"
+              f"{'' if ok else '  FAIL'}")
+
+    print("store round trip (write/load, then shared-cache bytes)")
+    for level, path, dtype, error, volumes, dates in check_store_round_trip():
+        ok = error <= PRICE_TOLERANCE and volumes and dates
+        failed |= not ok
+        print(f"  ${level:<10,} {path:<6} {str(dtype):<7} max error {error:.2e}"
+              f"  volumes {'exact' if volumes else 'CHANGED'}"
+              f"  dates {'exact' if dates else 'CHANGED'}{'' if ok else '  FAIL'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,244 @@
+"""Offline benchmark of the data and analytics pipeline.
+
+Every stage the article page runs is timed against synthetic OHLCV frames
+of 500, 5k, 50k and 500k bars. A fake provider stands in for yfinance, so
+nothing goes upstream. For each (stage, size) the suite reports the best
+and median wall time over ``--repeat`` runs, plus the peak memory of one
+extra run traced with ``tracemalloc``. Results can be saved and compared
+against a previous run, so a regression shows up as a failing exit code::
+
+    python benchmarks/pipeline.py
+    python benchmarks/pipeline.py --sizes 500 5000 --json before.json
+    python benchmarks/pipeline.py --compare before.json
+"""
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from charts import (candlestick_figure, drawdown_figure, monthly_heatmap_figure, returns_figure,  # noqa: E402
+                    volatility_figure, volume_figure)
+from dataset import Dataset  # noqa: E402
+from drawdowns import drawdown_episodes  # noqa: E402
+from extremes import WEEK52, ExtremesState, rolling_extremes  # noqa: E402
+from indicators import compute_indicators  # noqa: E402
+from metrics import level_metrics, monthly_return_pivot, risk_metrics, rolling_levels  # noqa: E402
+from peers import Comparison  # noqa: E402
+from periodic import PeriodicReturns  # noqa: E402
+from price_store import PriceStore, frame_from_bytes, frame_to_bytes  # noqa: E402
+from risk import risk_metrics as batch_risk_metrics, rolling_sharpes  # noqa: E402
+from series_cache import slice_window  # noqa: E402
+from shared_cache import SharedCache, SQLiteBackend  # noqa: E402
+
+SIZES = (500, 5_000, 50_000, 500_000)
+TICKER = "BENCH"
+# A stage this much slower than the compared run counts as a regression
+REGRESSION = 0.20
+# ...and by at least this much in absolute terms, so sub-millisecond jitter is ignored
+NOISE_FLOOR_S = 0.001
+
+
+def synthetic_ohlcv(n, seed=0):
+    """Geometric random walk with plausible OHLCV bars. Daily bars up to
+    50k; larger frames use hourly bars to stay inside the Timestamp range."""
+    rng = np.random.default_rng(seed)
+    freq = "D" if n <= 50_000 else "h"
+    index = pd.date_range(end="2026-01-09", periods=n, freq=freq, tz="America/New_York")
+    close = 20 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    open_ = close * np.exp(rng.normal(0, 0.005, n))
+    spread = np.abs(rng.normal(0, 0.01, n))
+    return pd.DataFrame({
+        "Open": open_,
+        "High": np.maximum(open_, close) * (1 + spread),
+        "Low": np.minimum(open_, close) * (1 - spread),
+        "Close": close,
+        "Volume": rng.integers(1_000_000, 50_000_000, n),
+    }, index=index)
+
+
+class FakeProvider:
+    """Serves a fixed frame through the ``YFinanceProvider`` interface."""
+
+    interval = "1d"
+
+    def __init__(self, df):
+        self.df = df
+
+    def history(self, ticker, start=None):
+        if start is None:
+            return self.df
+        return self.df[self.df.index >= pd.Timestamp(start, tz=self.df.index.tz)]
+
+
+def with_indicators(df):
+    df = df.copy()
+    for name, values in compute_indicators(df["Close"].to_numpy()).items():
+        df[name] = values
+    return df
+
+
+def rolling_extremes_pandas(df):
+    # What the 52-week columns cost with pandas' rolling windows
+    return (df["High"].rolling(WEEK52, min_periods=1).max(), df["Low"].rolling(WEEK52, min_periods=1).min())
+
+
+def build_figures(df):
+    figures = [
+        candlestick_figure(TICKER, df, levels=rolling_levels(df), extremes=rolling_extremes(df)), volume_figure(df), volatility_figure(df),
+        returns_figure(df), drawdown_figure(df), monthly_heatmap_figure(monthly_return_pivot(df)),
+    ]
+    # Serialization is part of what the page pays for every chart
+    return [fig.to_json(validate=False) for fig in figures]
+
+
+def stages(df, root):
+    """``[(name, setup, run)]``; ``setup()`` runs untimed before each ``run(state)``."""
+    enriched = with_indicators(df)
+    warm = PriceStore(os.path.join(root, "warm"))
+    warm.write(TICKER, df)
+    provider = FakeProvider(df)
+
+    def cold_store():
+        path = tempfile.mkdtemp(dir=root)
+        return PriceStore(path)
+
+    def delta_store():
+        # Everything but the last two bars is already stored
+        store = cold_store()
+        store.write(TICKER, df.iloc[:-2])
+        return store
+
+    # Another replica already published the series to the shared cache
+    published = SharedCache(SQLiteBackend(os.path.join(tempfile.mkdtemp(dir=root), "shared.sqlite")))
+    published.put(("history", TICKER, "1d"), df, 3600, frame_to_bytes)
+
+    def shared_hit(cache):
+        return cache.fetch(("history", TICKER, "1d"), lambda: None, 3600, frame_to_bytes, frame_from_bytes)
+
+    close = df["Close"].to_numpy()
+    high, low = df["High"].to_numpy(), df["Low"].to_numpy()
+    # The same returns shifted per column stand in for a 50-ticker coverage universe
+    universe = np.column_stack([np.roll(enriched["Daily_Return"].to_numpy(), k) for k in range(50)])
+    # A stock and five comparisons, each missing a few different bars
+    peers = {f"P{k}": df.drop(df.index[k::97]) for k in range(6)}
+    # What 50 sessions rerunning the page load: private copies with the indicator
+    # columns written in, against views of one shared read-only dataset
+    indicators = compute_indicators(close)
+    shared = Dataset(df, indicators)
+
+    def session_copies(readers):
+        frames = [df.copy() for _ in range(readers)]
+        for frame in frames:
+            for name, values in indicators.items():
+                frame[name] = values
+        return frames
+    return [
+        ("fetch_cold", cold_store, lambda store: store.update(TICKER, provider)),
+        ("fetch_delta", delta_store, lambda store: store.update(TICKER, provider)),
+        ("store_load", lambda: warm, lambda store: slice_window(store.load(TICKER), "2024-01-01")),
+        ("shared_cache_hit", lambda: published, shared_hit),
+        ("indicators", lambda: close, compute_indicators),
+        ("session_copy_50", lambda: 50, session_copies),
+        ("session_view_50", lambda: 50, lambda readers: [shared.view() for _ in range(readers)]),
+        ("monthly_returns", lambda: enriched, monthly_return_pivot),
+        ("periodic_returns", lambda: enriched, lambda d: PeriodicReturns(d.index, d["Daily_Return"].to_numpy())),
+        ("periodic_50_tickers", lambda: universe, lambda u: PeriodicReturns(df.index, u)),
+        ("support_resistance", lambda: enriched, level_metrics),
+        ("rolling_levels", lambda: enriched, rolling_levels),
+        ("rolling_extremes", lambda: df, rolling_extremes),
+        ("rolling_extremes_pandas", lambda: df, rolling_extremes_pandas),
+        ("extremes_next_bar", lambda: ExtremesState.from_history(high[:-1], low[:-1]),
+         lambda state: state.update(high[-1:], low[-1:])),
+        ("risk_metrics", lambda: enriched, risk_metrics),
+        ("risk_batch_50", lambda: universe, batch_risk_metrics),
+        ("rolling_sharpe", lambda: enriched["Daily_Return"].to_numpy(), rolling_sharpes),
+        ("compare_5_peers", lambda: peers, Comparison),
+        ("drawdown_episodes", lambda: enriched, lambda d: drawdown_episodes(d.index, d["Drawdown"].to_numpy())),
+        ("figures", lambda: enriched, build_figures),
+    ]
+
+
+def measure(setup, run, repeat):
+    times = []
+    for _ in range(repeat):
+        state = setup()
+        gc.collect()
+        start = time.perf_counter()
+        run(state)
+        times.append(time.perf_counter() - start)
+
+    state = setup()
+    gc.collect()
+    tracemalloc.start()
+    run(state)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"best_s": min(times), "median_s": statistics.median(times), "peak_bytes": peak}
+
+
+def run_suite(sizes=SIZES, repeat=5, only=None):
+    """Returns ``{"<stage>/<size>": {"best_s", "median_s", "peak_bytes"}}``."""
+    results = {}
+    with tempfile.TemporaryDirectory() as root:
+        for n in sizes:
+            df = synthetic_ohlcv(n)
+            # Large frames get fewer repeats so the whole suite stays a few minutes
+            reps = max(1, repeat if n <= 50_000 else repeat // 2)
+            for name, setup, run in stages(df, root):
+                if only and name not in only:
+                    continue
+                result = measure(setup, run, reps)
+                results[f"{name}/{n}"] = result
+                print(f"{name:<20} {n:>8,} bars  {result['best_s'] * 1000:10.2f} ms best"
+                      f"  {result['median_s'] * 1000:10.2f} ms median  {result['peak_bytes'] / 2**20:9.2f} MiB peak",
+                      flush=True)
+    return results
+
+
+def compare(results, baseline):
+    """Stages whose best time regressed by more than ``REGRESSION``."""
+    regressions = []
+    for key, result in results.items():
+        before = baseline.get(key)
+        if not before:
+            continue
+        slower = result["best_s"] - before["best_s"]
+        if slower > before["best_s"] * REGRESSION and slower > NOISE_FLOOR_S:
+            regressions.append((key, before["best_s"], result["best_s"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the pipeline on synthetic OHLCV data.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="frame lengths in bars")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per stage (default %(default)s)")
+    parser.add_argument("--stage", action="append", help="only run this stage (repeatable)")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--compare", help="results file from an earlier run to check for regressions")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.sizes, args.repeat, args.stage)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f))
+        for key, before, after in regressions:
+            print(f"REGRESSION {key}: {before * 1000:.2f} ms -> {after * 1000:.2f} ms")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,92 @@
+"""Screener refresh time over a synthetic universe.
+
+Writes ``--tickers`` synthetic series into a temporary price store, then
+times a cold screen on one process, a cold screen on the process pool (pool
+start-up is timed separately) and a cached re-screen. It fails if the
+pooled scores differ from the single-process ones, or if any ticker's row
+differs from the article's own metrics for that ticker::
+
+    python benchmarks/screen_universe.py
+    python benchmarks/screen_universe.py --tickers 5000 --bars 2500 --workers 8
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extremes import rolling_extremes  # noqa: E402
+from indicators import compute_indicators  # noqa: E402
+from metrics import headline_metrics, level_metrics, risk_metrics, volume_metrics  # noqa: E402
+from pipeline import synthetic_ohlcv  # noqa: E402
+from price_store import PriceStore  # noqa: E402
+from screener import Screener  # noqa: E402
+
+
+def article_row(df):
+    """The same columns, from the article page's metric functions."""
+    df = df.copy()
+    for name, values in compute_indicators(df["Close"].to_numpy()).items():
+        df[name] = values
+    m = {**headline_metrics(df), **level_metrics(df), **volume_metrics(df), **risk_metrics(df)}
+    extremes = rolling_extremes(df).iloc[-1]
+    return {
+        "last_close": m["current_price"], "pct_change": m["pct_change"],
+        "range_position": (m["current_price"] - float(m["low_52w"])) / (float(m["high_52w"]) - float(m["low_52w"])) * 100,
+        "current_volatility": m["current_volatility"], "max_drawdown": m["max_drawdown"],
+        "sharpe_ratio": m["sharpe_ratio"], "dist_resistance": m["dist_resistance"], "dist_support": m["dist_support"],
+        "new_high": extremes["New_High"], "new_low": extremes["New_Low"],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time a screener refresh over a synthetic universe.")
+    parser.add_argument("--tickers", type=int, default=1000, help="universe size (default %(default)s)")
+    parser.add_argument("--bars", type=int, default=500, help="bars per ticker (default %(default)s)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="pool size (default: every core)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as root:
+        store = PriceStore(root)
+        names = [f"T{i:05d}" for i in range(args.tickers)]
+        for i, name in enumerate(names):
+            # Different lengths, so the packed offsets are uneven
+            store.write(name, synthetic_ohlcv(args.bars - i % 50, seed=i))
+
+        serial = Screener(store, workers=1)
+        t0 = time.perf_counter()
+        expected, _ = serial.screen(names)
+        print(f"1 process        {time.perf_counter() - t0:8.2f} s")
+
+        pooled = Screener(store, workers=args.workers, parallel_min=1)
+        t0 = time.perf_counter()
+        pooled.start()
+        print(f"pool start-up    {time.perf_counter() - t0:8.2f} s  ({args.workers} workers)")
+        t0 = time.perf_counter()
+        table, _ = pooled.screen(names)
+        print(f"{args.workers} processes     {time.perf_counter() - t0:8.2f} s")
+        t0 = time.perf_counter()
+        pooled.screen(names)
+        print(f"cached re-screen {time.perf_counter() - t0:8.2f} s")
+        pooled._pool.shutdown()
+
+        failed = False
+        if not np.allclose(table.drop(columns="last_bar").astype(float), expected.drop(columns="last_bar").astype(float),
+                           equal_nan=True):
+            print("FAIL: pooled scores differ from the single-process ones")
+            failed = True
+        for name in names[:: max(len(names) // 20, 1)]:
+            row = article_row(store.load(name))
+            got = table.loc[name]
+            if not all(np.isclose(got[column], value, rtol=1e-9, equal_nan=True) for column, value in row.items()):
+                print(f"FAIL: {name} differs from the article metrics")
+                failed = True
+        return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
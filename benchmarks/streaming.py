@@ -0,0 +1,88 @@
+"""Streaming indicator updates against the batch engine.
+
+Seeds an ``IndicatorState`` from the first part of a synthetic series, appends
+the rest through ``update`` (in one call, and one bar at a time), and fails
+if any indicator differs from ``compute_indicators`` on the full series by
+more than ``RTOL``/``ATOL``. Split points include the start, the edges of
+the rolling windows and a stretch past ``RESYNC_EVERY``, where the running
+sums are recomputed. Also reports the cost per appended bar::
+
+    python benchmarks/streaming.py
+    python benchmarks/streaming.py --bars 50000 --appended 500
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from indicators import (INDICATORS, MA_WINDOWS, RESYNC_EVERY, VOL_WINDOW, IndicatorState,  # noqa: E402
+                        compute_indicators)
+from pipeline import synthetic_ohlcv  # noqa: E402
+
+RTOL = 1e-9
+ATOL = 1e-8
+
+
+def worst_mismatch(expected, got, start):
+    """``(indicator, max abs error)`` for the rows from ``start``; None when all are within tolerance."""
+    worst = None
+    for name in INDICATORS:
+        want, have = expected[name][start:], got[name]
+        if not np.allclose(have, want, rtol=RTOL, atol=ATOL, equal_nan=True):
+            with np.errstate(invalid="ignore"):
+                error = float(np.nanmax(np.abs(have - want)))
+            if worst is None or error > worst[1]:
+                worst = (name, error)
+    return worst
+
+
+def check(close, splits, appended):
+    """``[(split, mode, mismatch)]`` for a state seeded with ``close[:split]``."""
+    expected = compute_indicators(close)
+    results = []
+    for split in splits:
+        state = IndicatorState.from_history(close[:split])
+        results.append((split, "one call", worst_mismatch(expected, state.update(close[split:]), split)))
+        state = IndicatorState.from_history(close[:split])
+        end = min(split + appended, len(close))
+        rows = [state.update(close[i:i + 1]) for i in range(split, end)]
+        got = {name: np.concatenate([row[name] for row in rows]) for name in INDICATORS}
+        results.append((split, "per bar", worst_mismatch({n: v[:end] for n, v in expected.items()}, got, split)))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check streaming indicator updates against the batch engine.")
+    parser.add_argument("--bars", type=int, default=20_000, help="series length (default %(default)s)")
+    parser.add_argument("--appended", type=int, default=300, help="bars appended one at a time (default %(default)s)")
+    args = parser.parse_args(argv)
+
+    close = synthetic_ohlcv(args.bars)["Close"].to_numpy()
+    windows = [VOL_WINDOW, VOL_WINDOW + 1] + sorted(MA_WINDOWS.values())
+    edges = [0, 1, 2] + windows + [w - 1 for w in windows] + [RESYNC_EVERY - 10, args.bars // 2]
+    splits = sorted({split for split in edges if split < args.bars})
+
+    failed = False
+    print(f"{args.bars:,} bars, tolerance rtol {RTOL} / atol {ATOL}")
+    for split, mode, mismatch in check(close, splits, args.appended):
+        failed |= mismatch is not None
+        status = "ok" if mismatch is None else f"FAIL: {mismatch[0]} off by {mismatch[1]:.2e}"
+        print(f"  from bar {split:<7,} {mode:<9} {status}")
+
+    state = IndicatorState.from_history(close[:-args.appended])
+    t0 = time.perf_counter()
+    for i in range(len(close) - args.appended, len(close)):
+        state.update(close[i:i + 1])
+    per_bar = (time.perf_counter() - t0) / args.appended
+    t0 = time.perf_counter()
+    compute_indicators(close)
+    print(f"append one bar {per_bar * 1e6:8.1f} us   full batch pass {(time.perf_counter() - t0) * 1e3:8.2f} ms")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,247 @@
+"""Plotly figure factory for the article charts.
+
+The editorial look (fonts, colours, grid, margins) is defined once as the
+registered ``editorial`` Plotly template; each builder only sets what is
+specific to its chart. ``FigureCache`` memoizes built figures per
+(ticker, data range and last bar, chart kind, point budget) so reruns skip
+building and validating the Plotly objects.
+
+Plotly is imported inside the builders, so importing this module (for
+``FigureCache``) does not pull it in before the first chart is drawn.
+"""
+import numpy as np
+import pandas as pd
+
+from downsample import downsample_bars, downsample_line, ohlc_downsample, point_budget
+from extremes import DONCHIAN_WINDOW
+from series_cache import LRUCache, frame_key
+
+TEMPLATE_NAME = "editorial"
+FONT = "Inter, sans-serif"
+UP = "#00897b"
+DOWN = "#c62828"
+MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+_AXIS = dict(
+    title=dict(text="", font=dict(size=11, color="#666", family=FONT)),
+    tickfont=dict(size=10, color="#444"),
+    gridcolor="#e8e8e8",
+)
+
+
+def register_template():
+    """Register the editorial template with Plotly (idempotent)."""
+    import plotly.graph_objects as go
+    import plotly.io as pio
+
+    if TEMPLATE_NAME not in pio.templates:
+        pio.templates[TEMPLATE_NAME] = go.layout.Template(layout=dict(
+            title=dict(font=dict(size=16, color="#000", family=FONT, weight=700), x=0, xanchor="left"),
+            xaxis=_AXIS,
+            yaxis=_AXIS,
+            plot_bgcolor="#ffffff",
+            paper_bgcolor="#ffffff",
+            font=dict(family=FONT),
+            showlegend=False,
+            legend=dict(font=dict(size=10, color="#444"), bgcolor="rgba(255,255,255,0)",
+                        x=0, y=1.1, orientation="h"),
+            margin=dict(l=70, r=30, t=50, b=40),
+        ))
+    return TEMPLATE_NAME
+
+
+def _layout(fig, title, height, y_title="", **extra):
+    fig.update_layout(
+        template=register_template(),
+        title_text=title,
+        yaxis_title_text=y_title,
+        height=height,
+        **extra,
+    )
+    return fig
+
+
+def _area(x, y, name, color, fill):
+    import plotly.graph_objects as go
+
+    return go.Scatter(x=x, y=y, fill="tozeroy", name=name,
+                      line=dict(color=color, width=2), fillcolor=fill)
+
+
+def candlestick_figure(ticker, df, budget=None, levels=None, extremes=None):
+    """``levels``: optional frame of rolling Resistance/Support, drawn over the candles.
+    ``extremes``: optional ``extremes.rolling_extremes`` frame; the 52-week high/low
+    are drawn as steps with markers on new highs/lows, the Donchian channel is
+    in the legend, hidden until clicked."""
+    import plotly.graph_objects as go
+
+    candles = ohlc_downsample(df, budget or point_budget("candle"))
+    fig = go.Figure(data=[go.Candlestick(
+        x=candles.index,
+        open=candles["Open"],
+        high=candles["High"],
+        low=candles["Low"],
+        close=candles["Close"],
+        name=ticker,
+        increasing_line_color=UP,
+        decreasing_line_color=DOWN,
+        increasing_fillcolor=UP,
+        decreasing_fillcolor=DOWN,
+    )])
+    if levels is not None:
+        for column, color in (("Resistance", DOWN), ("Support", UP)):
+            x, y = downsample_line(levels.index, levels[column], budget or point_budget("line"))
+            fig.add_trace(go.Scatter(x=x, y=y, name=column, mode="lines",
+                                     line=dict(color=color, width=1.5, dash="dot")))
+    if extremes is not None:
+        for column, name, color in (("High_52W", "52W High", DOWN), ("Low_52W", "52W Low", UP)):
+            x, y = downsample_line(extremes.index, extremes[column], budget or point_budget("line"))
+            fig.add_trace(go.Scatter(x=x, y=y, name=name, mode="lines", line_shape="hv",
+                                     line=dict(color=color, width=1)))
+        for column, fill in (("Donchian_High", "none"), ("Donchian_Low", "tonexty")):
+            x, y = downsample_line(extremes.index, extremes[column], budget or point_budget("line"))
+            fig.add_trace(go.Scatter(x=x, y=y, name=f"{DONCHIAN_WINDOW}D Channel", mode="lines", line_shape="hv",
+                                     line=dict(color="#888", width=1), fill=fill, fillcolor="rgba(136,136,136,0.1)",
+                                     legendgroup="donchian", showlegend=fill == "none", visible="legendonly"))
+        # New highs/lows are few, so every one is drawn, at the bar's high/low
+        for flag, column, name, symbol, color in (("New_High", "High_52W", "New 52W High", "triangle-up", UP),
+                                                  ("New_Low", "Low_52W", "New 52W Low", "triangle-down", DOWN)):
+            hits = extremes[extremes[flag]]
+            fig.add_trace(go.Scatter(x=hits.index, y=hits[column], name=name, mode="markers",
+                                     marker=dict(symbol=symbol, color=color, size=7)))
+    axis_line = dict(showline=True, linecolor="#ccc", linewidth=1)
+    return _layout(fig, f"{ticker} Stock Price", 520, "Price (USD)",
+                   xaxis=axis_line, yaxis=axis_line, xaxis_rangeslider_visible=False,
+                   showlegend=levels is not None or extremes is not None)
+
+
+def volume_figure(df, budget=None):
+    import plotly.graph_objects as go
+
+    bar_x, bar_y = downsample_bars(df.index, df["Volume"].to_numpy(), budget or point_budget("bar"))
+    avg_x, avg_y = downsample_line(df.index, df["Volume"].rolling(window=20).mean(),
+                                   budget or point_budget("line"))
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=bar_x,
+        y=bar_y,
+        name="Volume",
+        marker=dict(color=bar_y, colorscale=[[0, "#bdd7f0"], [0.5, "#5fa3d6"], [1, "#1565c0"]],
+                    showscale=False),
+    ))
+    fig.add_trace(go.Scatter(x=avg_x, y=avg_y, name="20-Day Average", line=dict(color=DOWN, width=2)))
+    return _layout(fig, "Trading Volume", 380, "Volume", showlegend=True)
+
+
+def volatility_figure(df, budget=None):
+    import plotly.graph_objects as go
+
+    x, y = downsample_line(df.index, df["Volatility_20"], budget or point_budget("line"))
+    fig = go.Figure(_area(x, y, "20-Day Volatility", "#d4af37", "rgba(212, 175, 55, 0.15)"))
+    return _layout(fig, "Historical Volatility (20-Day Rolling)", 380, "Volatility (%)")
+
+
+def returns_figure(df, budget=None, title="Cumulative Returns Since January 2024"):
+    import plotly.graph_objects as go
+
+    x, y = downsample_line(df.index, df["Cumulative_Return"] * 100, budget or point_budget("line"))
+    fig = go.Figure(_area(x, y, "Cumulative Return", UP, "rgba(0, 137, 123, 0.12)"))
+    return _layout(fig, title, 420, "Return (%)")
+
+
+def drawdown_figure(df, budget=None, episodes=None):
+    """``episodes``: optional drawdown episodes to shade and label at their troughs."""
+    import plotly.graph_objects as go
+
+    x, y = downsample_line(df.index, df["Drawdown"], budget or point_budget("line"))
+    fig = go.Figure(_area(x, y, "Drawdown", DOWN, "rgba(198, 40, 40, 0.15)"))
+    if episodes is not None:
+        for row in episodes.itertuples():
+            end = df.index[-1] if pd.isna(row.recovery) else row.recovery
+            fig.add_vrect(x0=row.peak, x1=end, fillcolor="rgba(0, 0, 0, 0.04)", line_width=0, layer="below")
+            fig.add_annotation(x=row.trough, y=row.depth, text=f"{row.depth:.1f}% / {row.underwater_days}d",
+                               showarrow=True, arrowhead=0, arrowcolor="#999", ax=0, ay=24,
+                               font=dict(size=10, color="#444", family=FONT))
+    return _layout(fig, "Drawdown from Peak", 400, "Drawdown (%)")
+
+
+def rolling_sharpe_figure(df, sharpes, budget=None):
+    """``sharpes``: {window: rolling Sharpe array aligned with ``df``}."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    for (window, values), color in zip(sorted(sharpes.items()), ("#1565c0", "#d4af37")):
+        x, y = downsample_line(df.index, values, budget or point_budget("line"))
+        fig.add_trace(go.Scatter(x=x, y=y, name=f"{window}-Day", line=dict(color=color, width=2)))
+    fig.add_hline(y=0, line_width=1, line_color="#999")
+    return _layout(fig, "Rolling Sharpe Ratio", 360, "Sharpe (annualized)", showlegend=True)
+
+
+COMPARISON_COLORS = ("#1565c0", "#d4af37", "#6a1b9a", "#ef6c00", "#2e7d32", "#5d4037")
+
+
+def relative_performance_figure(dates, names, growth, budget=None):
+    """Growth since the common start, in percent; ``names[0]`` is the stock."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    for j, name in enumerate(names):
+        x, y = downsample_line(dates, growth[:, j] * 100, budget or point_budget("line"))
+        color = UP if j == 0 else COMPARISON_COLORS[(j - 1) % len(COMPARISON_COLORS)]
+        fig.add_trace(go.Scatter(x=x, y=y, name=name, line=dict(color=color, width=3 if j == 0 else 1.5)))
+    fig.add_hline(y=0, line_width=1, line_color="#999")
+    return _layout(fig, "Relative Performance", 420, "Return (%)", showlegend=True)
+
+
+def rolling_relation_figure(dates, names, values, title, y_title, budget=None):
+    """One line per comparison (``names[1:]``) of a rolling statistic against the stock."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    for j, name in enumerate(names[1:], start=1):
+        x, y = downsample_line(dates, values[:, j], budget or point_budget("line"))
+        fig.add_trace(go.Scatter(x=x, y=y, name=name,
+                                 line=dict(color=COMPARISON_COLORS[(j - 1) % len(COMPARISON_COLORS)], width=2)))
+    return _layout(fig, title, 340, y_title, showlegend=True)
+
+
+def monthly_heatmap_figure(pivot):
+    """``pivot``: monthly returns in percent, months (1-12) as rows, years as columns."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure(data=go.Heatmap(
+        z=pivot.values,
+        x=pivot.columns,
+        y=[MONTH_NAMES[i - 1] for i in pivot.index],
+        colorscale=[[0, DOWN], [0.5, "#ffffff"], [1, UP]],
+        zmid=0,
+        text=np.round(pivot.values, 2),
+        texttemplate="%{text}%",
+        textfont={"size": 10, "color": "#1a2332", "family": FONT},
+        colorbar=dict(
+            title=dict(text="Return (%)", font=dict(size=11, family=FONT)),
+            tickfont=dict(size=10, family=FONT),
+        ),
+    ))
+    return _layout(fig, "Monthly Returns Distribution", 420,
+                   xaxis_showgrid=False, yaxis_showgrid=False,
+                   margin=dict(l=60, r=40, t=50, b=40))
+
+
+class FigureCache:
+    """Built figures keyed on (ticker, ``frame_key``, kind, budget), so a
+    corrected last bar builds a new figure."""
+
+    def __init__(self, maxsize=256):
+        self._cache = LRUCache(maxsize)
+
+    def get(self, ticker, df, kind, build, budget=None):
+        key = (ticker, frame_key(df), kind, budget)
+        fig = self._cache.get(key)
+        if fig is None:
+            fig = build()
+            self._cache.put(key, fig)
+        return fig
+
+    def stats(self):
+        return self._cache.stats()
@@ -0,0 +1,107 @@
+"""Compact in-memory schema for stored price series.
+
+Precision policy:
+
+- Open/High/Low/Close are float32 when every price round-trips within
+  ``PRICE_TOLERANCE`` (half a cent), which holds for anything under about
+  $100k; otherwise the series keeps float64. All four share one dtype.
+- Volume is uint32 when it fits, uint64 otherwise. Sums over bars (chart
+  buckets) are taken in uint64.
+- Anything derived (returns, indicators, risk) is computed in float64 from
+  these columns, so float32 rounding never compounds.
+
+``compact_columns`` applies the policy to the columns a ``PriceStore`` frame
+is built from. ``CompactSeries`` is the struct-of-arrays form (int32 epoch
+days instead of a DatetimeIndex) for holding many daily series at once.
+"""
+import numpy as np
+import pandas as pd
+
+PRICE_COLUMNS = ("Open", "High", "Low", "Close")
+COLUMNS = PRICE_COLUMNS + ("Volume",)
+PRICE_TOLERANCE = 0.005
+NS_PER_DAY = 86_400 * 10**9
+
+
+def price_dtype(*columns, tolerance=PRICE_TOLERANCE):
+    """float32 if every value of ``columns`` survives it within ``tolerance``, else float64."""
+    for values in columns:
+        values = np.asarray(values, dtype=np.float64)
+        with np.errstate(invalid="ignore"):
+            error = np.abs(values.astype(np.float32).astype(np.float64) - values)
+        if len(values) and np.nanmax(error, initial=0.0) > tolerance:
+            return np.dtype(np.float64)
+    return np.dtype(np.float32)
+
+
+def volume_dtype(values):
+    values = np.asarray(values)
+    if len(values) and values.min() < 0:
+        raise ValueError("volume cannot be negative")
+    return np.dtype(np.uint32 if not len(values) or values.max() <= np.iinfo(np.uint32).max else np.uint64)
+
+
+def compact_columns(columns):
+    """``{column: array}`` for the OHLCV ``columns``, in the policy dtypes."""
+    prices = price_dtype(*(columns[name] for name in PRICE_COLUMNS))
+    out = {name: np.asarray(columns[name]).astype(prices) for name in PRICE_COLUMNS}
+    out["Volume"] = np.asarray(columns["Volume"]).astype(volume_dtype(columns["Volume"]))
+    return out
+
+
+def frame_nbytes(df):
+    return int(df.memory_usage(index=True, deep=False).sum())
+
+
+class CompactSeries:
+    """One daily OHLCV series as plain arrays: ``days`` are int32 days since
+    1970-01-01 of each bar's local session date, ``tz`` the index timezone."""
+
+    __slots__ = ("days", "tz", "open", "high", "low", "close", "volume")
+
+    def __init__(self, days, tz, open, high, low, close, volume):
+        self.days = days
+        self.tz = tz
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+
+    @classmethod
+    def from_frame(cls, df):
+        index = df.index
+        tz = str(index.tz) if index.tz is not None else None
+        local = (index.tz_localize(None) if tz else index).as_unit("ns").asi8
+        if len(local) and (local % NS_PER_DAY).any():
+            raise ValueError("CompactSeries only holds daily bars stamped at midnight")
+        columns = compact_columns({name: df[name].to_numpy() for name in COLUMNS})
+        return cls((local // NS_PER_DAY).astype(np.int32), tz, columns["Open"], columns["High"],
+                   columns["Low"], columns["Close"], columns["Volume"])
+
+    def to_frame(self):
+        """The series as a store-style DataFrame; the columns wrap these arrays."""
+        index = pd.DatetimeIndex(self.days.astype(np.int64) * NS_PER_DAY, name="Date")
+        if self.tz is not None:
+            index = index.tz_localize(self.tz)
+        columns = dict(zip(COLUMNS, (self.open, self.high, self.low, self.close, self.volume)))
+        return pd.DataFrame(columns, index=index, copy=False)
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, name).nbytes for name in self.__slots__ if name != "tz")
+
+    def __len__(self):
+        return len(self.days)
+
+
+def memory_report(series):
+    """One row per ticker of ``{ticker: DataFrame or CompactSeries}``: bars,
+    bytes held and bytes per bar."""
+    rows = []
+    for ticker, value in series.items():
+        nbytes = value.nbytes if isinstance(value, CompactSeries) else frame_nbytes(value)
+        bars = len(value)
+        rows.append({"ticker": ticker, "bars": bars, "bytes": nbytes,
+                     "bytes_per_bar": round(nbytes / bars, 1) if bars else 0.0})
+    return rows
@@ -0,0 +1,71 @@
+"""Read-only price datasets shared by every session.
+
+A ``Dataset`` is one date window of a stored series with the indicator
+columns attached, built once per process. Its columns are the window's own
+arrays and the engine's indicator block, wrapped without copying and
+marked read-only, so a stray in-place write raises instead of leaking into
+other sessions. Readers get ``view()``: a shallow copy that shares every
+array but has its own column list, so adding a column stays local.
+"""
+import numpy as np
+import pandas as pd
+
+from compact import frame_nbytes, memory_report
+from series_cache import LRUCache, canonical_range
+
+
+def _read_only(values):
+    # A new array object over the same memory; the source keeps its own flags
+    values = values.view()
+    values.flags.writeable = False
+    return values
+
+
+class Dataset:
+    """``window`` (OHLCV) plus ``indicators`` as one read-only frame."""
+
+    def __init__(self, window, indicators, ticker=None):
+        self.ticker = ticker
+        columns = {name: _read_only(window[name].to_numpy()) for name in window.columns}
+        columns.update((name, _read_only(np.asarray(values))) for name, values in indicators.items())
+        self.frame = pd.DataFrame(columns, index=window.index, copy=False)
+
+    def view(self):
+        """The shared frame behind a per-caller column list (no data copied)."""
+        return self.frame.copy(deep=False)
+
+    @property
+    def nbytes(self):
+        return frame_nbytes(self.frame)
+
+    def __len__(self):
+        return len(self.frame)
+
+
+class DatasetCache:
+    """Datasets keyed like ``WindowCache`` windows: (ticker, interval, canonical range).
+
+    An entry is reused while the window cache hands back the same window
+    object, so a refreshed series rebuilds its datasets on next use.
+    """
+
+    def __init__(self, windows, engine, maxsize=256):
+        self._windows = windows
+        self._engine = engine
+        self._cache = LRUCache(maxsize)
+
+    def get(self, series, ticker, interval="1d", start=None, end=None):
+        window = self._windows.get(series, ticker, interval, start, end)
+        key = (ticker, interval) + canonical_range(start, end)
+        entry = self._cache.get(key, valid=lambda e: e[0] is window)
+        if entry is None:
+            entry = (window, Dataset(window, self._engine.compute(ticker, window), ticker))
+            self._cache.put(key, entry)
+        return entry[1]
+
+    def memory_report(self):
+        """Bytes held per cached ticker (see ``compact.memory_report``)."""
+        return memory_report({entry[1].ticker: entry[1].frame for entry in self._cache.values()})
+
+    def stats(self):
+        return {**self._cache.stats(), "bytes": sum(entry[1].nbytes for entry in self._cache.values())}
@@ -0,0 +1,115 @@
+"""Chart payload downsampling, applied before Plotly figures are built.
+
+- ``lttb_indices``: Largest-Triangle-Three-Buckets for line/area series.
+- ``minmax_indices``: keeps each bucket's min and max, for bar series where
+  spikes must survive.
+- ``ohlc_downsample``: OHLC-preserving bucket aggregation for candlesticks.
+
+Budgets come from ``point_budget``, keyed to the chart width in pixels, so a
+figure's payload stays bounded however long the underlying history is.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+CHART_WIDTH = int(os.environ.get("CHART_WIDTH", "1400"))
+# Pixels each drawn point needs to stay legible
+PX_PER_POINT = {"line": 1, "bar": 1, "candle": 2}
+
+
+def point_budget(kind, width=CHART_WIDTH):
+    return max(int(width / PX_PER_POINT[kind]), 3)
+
+
+def _as_float(x):
+    if isinstance(x, pd.DatetimeIndex):
+        return x.asi8.astype(np.float64)
+    return np.asarray(x, dtype=np.float64)
+
+
+def lttb_indices(x, y, n_out):
+    """Indices of the points LTTB keeps; NaN points are skipped."""
+    y = np.asarray(y, dtype=np.float64)
+    valid = np.flatnonzero(~np.isnan(y))
+    n = len(valid)
+    if n_out >= n or n_out < 3:
+        return valid
+    xs = _as_float(x)[valid]
+    ys = y[valid]
+
+    # First and last points are always kept; the rest is split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Average of the next bucket (or the last point) is the third triangle vertex
+        nlo, nhi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        cx = xs[nlo:nhi].mean()
+        cy = ys[nlo:nhi].mean()
+        area = np.abs((xs[a] - cx) * (ys[lo:hi] - ys[a]) - (xs[a] - xs[lo:hi]) * (cy - ys[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return valid[keep]
+
+
+def minmax_indices(y, n_out):
+    """Indices of each bucket's min and max (in time order), about n_out points."""
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    buckets = max(n_out // 2, 1)
+    if n <= n_out:
+        return np.arange(n)
+    edges = np.linspace(0, n, buckets + 1).astype(np.int64)
+    filled = np.where(np.isnan(y), -np.inf, y)
+    lo_idx = np.empty(buckets, dtype=np.int64)
+    hi_idx = np.empty(buckets, dtype=np.int64)
+    for i in range(buckets):
+        seg = filled[edges[i]:edges[i + 1]]
+        hi_idx[i] = edges[i] + int(np.argmax(seg))
+        lo_idx[i] = edges[i] + int(np.argmin(np.where(np.isinf(seg), np.inf, seg)))
+    return np.unique(np.concatenate([lo_idx, hi_idx]))
+
+
+def ohlc_downsample(df, n_out):
+    """Aggregate consecutive bars into at most ``n_out`` candles.
+
+    Each bucket takes the first Open, max High, min Low, last Close and the
+    summed Volume; it is stamped with its first bar's timestamp.
+    """
+    n = len(df)
+    if n <= n_out:
+        return df
+    starts = np.linspace(0, n, n_out + 1).astype(np.int64)[:-1]
+    ends = np.append(starts[1:], n) - 1
+    out = {
+        "Open": df["Open"].to_numpy()[starts],
+        "High": np.maximum.reduceat(df["High"].to_numpy(), starts),
+        "Low": np.minimum.reduceat(df["Low"].to_numpy(), starts),
+        "Close": df["Close"].to_numpy()[ends],
+    }
+    if "Volume" in df:
+        # Bucket sums can overflow the stored uint32
+        out["Volume"] = np.add.reduceat(df["Volume"].to_numpy(), starts, dtype=np.uint64)
+    return pd.DataFrame(out, index=df.index[starts])
+
+
+def downsample_line(index, values, n_out):
+    """``(x, y)`` for a line/area trace, reduced with LTTB to ``n_out`` points."""
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) <= n_out:
+        return index, values
+    keep = lttb_indices(index, values, n_out)
+    return index[keep], values[keep]
+
+
+def downsample_bars(index, values, n_out):
+    """``(x, y)`` for a bar trace, reduced with min-max buckets to about ``n_out`` bars."""
+    values = np.asarray(values)
+    if len(values) <= n_out:
+        return index, values
+    keep = minmax_indices(values, n_out)
+    return index[keep], values[keep]
@@ -0,0 +1,92 @@
+"""Drawdown episodes: every peak-to-recovery period in a price history.
+
+An episode starts at a running-max peak, reaches its trough, and ends on the
+first bar that closes back at (or above) the peak; the last episode may still
+be open. Everything is found in one linear, vectorized pass over the
+``Drawdown`` array produced by ``indicators.compute_indicators``.
+"""
+import numpy as np
+import pandas as pd
+
+
+def episode_bounds(drawdown):
+    """``(starts, ends, troughs)`` bar positions of each underwater run.
+
+    ``starts``/``ends`` are the first and last bar below the peak, ``troughs``
+    the first bar at each run's minimum. Runs never overlap, so per-run
+    reductions are a single ``reduceat`` over the run starts.
+    """
+    dd = np.asarray(drawdown, dtype=np.float64)
+    under = dd < 0  # NaN compares False, so it never opens an episode
+    if not under.any():
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, empty
+    edges = np.diff(under.astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+
+    # Minimum of every run, broadcast back over its bars
+    lengths = ends - starts + 1
+    positions = np.flatnonzero(under)
+    run_of = np.repeat(np.arange(len(starts)), lengths)
+    depth = np.minimum.reduceat(dd[positions], np.r_[0, np.cumsum(lengths)[:-1]])
+    at_min = dd[positions] == depth[run_of]
+    runs_at_min = run_of[at_min]
+    # First bar at the minimum of each run
+    first = np.r_[True, runs_at_min[1:] != runs_at_min[:-1]]
+    troughs = positions[at_min][first]
+    return starts, ends, troughs
+
+
+def drawdown_episodes(index, drawdown):
+    """One row per episode, in time order.
+
+    ``peak``/``trough``/``recovery`` are timestamps (``recovery`` is NaT while
+    the episode is open) and ``depth`` is the trough drawdown in percent.
+    ``decline_bars`` and ``recovery_bars`` count bars from peak to trough and
+    from trough to recovery (-1 while open); ``underwater_bars`` is the number
+    of bars below the peak and ``underwater_days`` the calendar days from the
+    peak to the recovery (or to the last bar).
+    """
+    dd = np.asarray(drawdown, dtype=np.float64)
+    # With no episode every column is simply empty, but keeps its dtype
+    starts, ends, troughs = episode_bounds(dd)
+    n = len(dd)
+    peaks = np.maximum(starts - 1, 0)
+    recovered = ends < n - 1
+    recoveries = np.where(recovered, ends + 1, n - 1)
+
+    index = pd.DatetimeIndex(index)
+    recovery_dates = index[recoveries].where(recovered)
+    return pd.DataFrame({
+        "peak": index[peaks],
+        "trough": index[troughs],
+        "recovery": recovery_dates,
+        "depth": dd[troughs],
+        "decline_bars": troughs - peaks,
+        "recovery_bars": np.where(recovered, recoveries - troughs, -1),
+        "underwater_bars": ends - starts + 1,
+        "underwater_days": (index[recoveries] - index[peaks]).days,
+    })
+
+
+def underwater_stats(episodes, n_bars):
+    """Time-underwater summary of ``drawdown_episodes`` over ``n_bars`` bars."""
+    if len(episodes) == 0 or n_bars == 0:
+        return {"episodes": 0, "underwater_pct": 0.0, "longest_days": 0, "average_days": 0.0,
+                "current_days": 0, "deepest": 0.0}
+    # An open episode runs to the last bar, so it is the current time underwater
+    open_days = episodes["underwater_days"].iloc[-1] if pd.isna(episodes["recovery"].iloc[-1]) else 0
+    return {
+        "episodes": len(episodes),
+        "underwater_pct": float(episodes["underwater_bars"].sum() / n_bars * 100),
+        "longest_days": int(episodes["underwater_days"].max()),
+        "average_days": float(episodes["underwater_days"].mean()),
+        "current_days": int(open_days),
+        "deepest": float(episodes["depth"].min()),
+    }
+
+
+def worst_episodes(episodes, count=5):
+    """The ``count`` deepest episodes, deepest first."""
+    return episodes.nsmallest(count, "depth")
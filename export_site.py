@@ -0,0 +1,303 @@
+"""Static-site export: pre-renders every STOCKS entry to a standalone HTML page.
+
+Pages are built from the local price store (no upstream calls unless
+``--refresh`` is given) and contain the prose, the metric tiles and the Plotly
+figures as embedded JSON. A manifest records each page's last bar (date and
+values) and a content fingerprint, so re-running only rebuilds tickers that
+got new or corrected bars, or whose article, stylesheet or rendering code
+changed::
+
+    python export_site.py --out site
+    python export_site.py --out site --refresh --inline-plotlyjs
+"""
+import argparse
+import hashlib
+import html
+import json
+import logging
+import os
+import sys
+
+from article import (ANALYSIS_DATE, ANALYSIS_NOTE, ANALYSIS_START, DISCLAIMER, SECTIONS, STYLESHEET,
+                     article_files, load_article, load_stylesheet, markdown_to_html)
+from charts import (candlestick_figure, drawdown_figure, monthly_heatmap_figure, relative_performance_figure,
+                    returns_figure, rolling_relation_figure, rolling_sharpe_figure, volatility_figure, volume_figure)
+from compact import COLUMNS
+from dataset import Dataset
+from drawdowns import drawdown_episodes, underwater_stats, worst_episodes
+from extremes import rolling_extremes
+from indicators import compute_indicators
+from metrics import (article_metrics, calendar_rows, comparison_rows, episode_rows, episode_tiles, header_tiles,
+                     return_tiles, risk_tiles, rolling_levels, tail_risk_tiles, volume_tiles)
+from peers import Comparison
+from periodic import PeriodicReturns
+from price_store import PriceStore, YFinanceProvider
+from risk import rolling_sharpes
+from series_cache import slice_window
+from stock_registry import comparison_tickers, load_stocks, tickers
+
+log = logging.getLogger("export_site")
+
+PLOTLY_CDN = "https://cdn.plot.ly/plotly-2.35.2.min.js"
+# Bump to rebuild every page; edits to this file or RENDER_MODULES already do
+TEMPLATE_VERSION = 7
+MANIFEST = "manifest.json"
+# Modules whose code shapes what a page shows; their source is part of the fingerprint
+RENDER_MODULES = ("article", "charts", "compact", "dataset", "downsample", "drawdowns", "extremes", "indicators",
+                  "metrics", "peers", "periodic", "risk")
+
+
+def _fingerprint(key):
+    digest = hashlib.sha256(str(TEMPLATE_VERSION).encode())
+    sources = [sys.modules[name].__file__ for name in RENDER_MODULES]
+    for path in article_files(key) + [STYLESHEET, __file__] + sources:
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _last_values(df):
+    return [float(df[name].iloc[-1]) for name in COLUMNS if name in df.columns]
+
+
+def _tiles_html(tiles):
+    cells = []
+    for label, value, delta in tiles:
+        delta_class = "tile-delta negative" if delta and delta.lstrip("$").startswith("-") else "tile-delta"
+        delta_html = f'<div class="{delta_class}">{html.escape(delta)}</div>' if delta else ""
+        cells.append(
+            f'<div class="tile"><div class="tile-label">{html.escape(label)}</div>'
+            f'<div class="tile-value">{html.escape(value)}</div>{delta_html}</div>'
+        )
+    return f'<div class="tiles">{"".join(cells)}</div>'
+
+
+def _table_html(rows):
+    if not rows:
+        return ""
+    head = "".join(f"<th>{html.escape(column)}</th>" for column in rows[0])
+    body = "".join("<tr>" + "".join(f"<td>{html.escape(str(v))}</td>" for v in row.values()) + "</tr>" for row in rows)
+    return f'<table class="data-table"><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>'
+
+
+def _figure_html(name, fig):
+    # Figures are embedded as JSON and drawn by the loader script at the end of the page
+    payload = fig.to_json(validate=False).replace("</", "<\\/")
+    return (f'<div class="chart" id="chart-{name}"></div>'
+            f'<script type="application/json" data-chart="chart-{name}">{payload}</script>')
+
+
+def _comparison_html(ticker, df, comparisons):
+    if not comparisons:
+        return ""
+    comparison = Comparison({ticker: df, **comparisons})
+    sub = '<div class="subsection-header">Against Benchmarks and Peers</div>'
+    return "\n".join([
+        sub,
+        _figure_html("relative", relative_performance_figure(comparison.dates, comparison.names, comparison.growth)),
+        _figure_html("correlation", rolling_relation_figure(comparison.dates, comparison.names, comparison.correlation,
+                                                            f"Rolling {comparison.window}-Day Correlation", "Correlation")),
+        _figure_html("beta", rolling_relation_figure(comparison.dates, comparison.names, comparison.beta,
+                                                     f"Rolling {comparison.window}-Day Beta", "Beta")),
+        _table_html(comparison_rows(comparison.summary())),
+    ])
+
+
+def render_page(key, stock, df, plotlyjs, comparisons=None):
+    """``comparisons``: optional ``{ticker: frame}`` of benchmarks/peers for the returns section."""
+    ticker = stock["ticker"]
+    m = article_metrics(df)
+    article = load_article(key)
+    prose = {name: f'<div class="analysis-template">{markdown_to_html(article[name])}</div>'
+             for name, _, _ in SECTIONS}
+    headers = {name: f'<div class="section-header" id="{anchor}">{html.escape(title)}</div>'
+               for name, anchor, title in SECTIONS}
+    sub = lambda text: f'<div class="subsection-header">{text}</div>'
+    toc = "".join(f'<li><a href="#{anchor}">{html.escape(title)}</a></li>' for _, anchor, title in SECTIONS)
+    periodic = PeriodicReturns(df.index, df["Daily_Return"].to_numpy())
+    episodes = drawdown_episodes(df.index, df["Drawdown"])
+    worst = worst_episodes(episodes, 5)
+    levels = (
+        '<div class="levels">'
+        f'<div class="metric-container"><p><strong>Resistance Level (90th percentile):</strong> ${m["resistance"]:.2f}</p>'
+        f'<p><strong>Distance from Resistance:</strong> {m["dist_resistance"]:.2f}%</p></div>'
+        f'<div class="metric-container"><p><strong>Support Level (10th percentile):</strong> ${m["support"]:.2f}</p>'
+        f'<p><strong>Distance from Support:</strong> {m["dist_support"]:.2f}%</p></div>'
+        '</div>'
+    )
+
+    body = "\n".join([
+        f'<div class="main-title">{html.escape(stock["name"])} ({html.escape(ticker)})</div>',
+        f'<div class="subtitle">Sector: {html.escape(stock["sector"])} | Analysis Period: January 2024 - Present'
+        f'<br><em>{html.escape(ANALYSIS_NOTE)}</em></div>',
+        _tiles_html(header_tiles(m)),
+        f'<div class="toc-container"><h3>Table of Contents</h3><ul>{toc}</ul></div>',
+        headers["overview"], prose["overview"],
+        headers["price_action"], sub("Price Performance"),
+        _figure_html("candle", candlestick_figure(ticker, df, levels=rolling_levels(df), extremes=rolling_extremes(df))),
+        levels, prose["price_action"],
+        headers["volume_volatility"], sub("Trading Volume"), _figure_html("volume", volume_figure(df)),
+        sub("Historical Volatility"), _figure_html("volatility", volatility_figure(df)),
+        _tiles_html(volume_tiles(m)), prose["volume_volatility"],
+        headers["returns"], sub("Cumulative Returns"), _figure_html("returns", returns_figure(df)),
+        sub("Monthly Returns Distribution"),
+        _figure_html("heatmap", monthly_heatmap_figure(periodic.monthly_pivot())),
+        _table_html(calendar_rows(periodic.calendar_table())),
+        _tiles_html(return_tiles(m)), _comparison_html(ticker, df, comparisons), prose["returns"],
+        headers["risk"], sub("Drawdown Analysis"),
+        _figure_html("drawdown", drawdown_figure(df, episodes=worst.head(3))),
+        _tiles_html(risk_tiles(m)), _tiles_html(tail_risk_tiles(m)),
+        _tiles_html(episode_tiles(underwater_stats(episodes, len(df)))),
+        _figure_html("rolling_sharpe", rolling_sharpe_figure(df, rolling_sharpes(df["Daily_Return"].to_numpy()))),
+        sub("Deepest Drawdowns"), _table_html(episode_rows(worst)), prose["risk"],
+        headers["conclusion"], prose["conclusion"],
+        f'<div class="data-source"><p><strong>Data Source:</strong> Yahoo Finance | '
+        f'<strong>Analysis Date:</strong> {ANALYSIS_DATE}</p>'
+        f'<p><strong>Disclaimer:</strong> {html.escape(DISCLAIMER)}</p></div>',
+    ])
+    return PAGE_TEMPLATE.format(
+        title=html.escape(f'{stock["name"]} ({ticker}) | Equity Research Blog'),
+        css=load_stylesheet() + EXPORT_CSS,
+        plotlyjs=plotlyjs,
+        body=body,
+    )
+
+
+def render_index(stocks, built):
+    items = "".join(
+        f'<li><a href="{html.escape(key)}.html">{html.escape(key)} - {html.escape(stock["name"])}</a>'
+        f' <span class="sector">{html.escape(stock["sector"])}</span></li>'
+        for key, stock in stocks.items() if key in built
+    )
+    body = (f'<div class="main-title">Finance Blog</div>'
+            f'<div class="subtitle">Stock Coverage</div><ul class="coverage">{items}</ul>')
+    return PAGE_TEMPLATE.format(title="Equity Research Blog", css=load_stylesheet() + EXPORT_CSS,
+                                plotlyjs="", body=body)
+
+
+def export_site(out_dir, stocks=None, store=None, refresh=False, force=False, inline_plotlyjs=False):
+    """Write one page per stock plus an index; returns the list of rebuilt keys."""
+    stocks = stocks or load_stocks()
+    store = store or PriceStore()
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, MANIFEST)
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+    if refresh:
+        store.update_many(tickers(stocks, comparisons=True), YFinanceProvider())
+
+    if inline_plotlyjs:
+        from plotly.offline import get_plotlyjs
+        plotlyjs = f"<script>{get_plotlyjs()}</script>"
+    else:
+        plotlyjs = f'<script src="{PLOTLY_CDN}"></script>'
+
+    rebuilt = []
+    built = set()
+    for key, stock in stocks.items():
+        series = store.load(stock["ticker"])
+        if series is None or series.empty:
+            log.warning("no stored data for %s, skipping (run with --refresh)", stock["ticker"])
+            continue
+        window = slice_window(series, ANALYSIS_START)
+        if window.empty:
+            continue
+        built.add(key)
+        comparisons = {}
+        for name in comparison_tickers(stock):
+            other = store.load(name)
+            other = slice_window(other, ANALYSIS_START) if other is not None else None
+            if other is not None and not other.empty:
+                comparisons[name] = other
+        # The last bar's values too: PriceStore.update rewrites a partial last bar in place
+        entry = {"last_bar": window.index[-1].isoformat(), "last_values": _last_values(window), "rows": len(window),
+                 "fingerprint": _fingerprint(key),
+                 "comparisons": {name: [other.index[-1].isoformat(), _last_values(other)]
+                                 for name, other in comparisons.items()}}
+        page_path = os.path.join(out_dir, f"{key}.html")
+        if not force and manifest.get(key) == entry and os.path.exists(page_path):
+            continue
+
+        df = Dataset(window, compute_indicators(window["Close"].to_numpy())).frame
+        with open(page_path, "w", encoding="utf-8") as f:
+            f.write(render_page(key, stock, df, plotlyjs, comparisons))
+        manifest[key] = entry
+        rebuilt.append(key)
+        log.info("rendered %s", page_path)
+
+    with open(os.path.join(out_dir, "index.html"), "w", encoding="utf-8") as f:
+        f.write(render_index(stocks, built))
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return rebuilt
+
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<style>
+{css}
+</style>
+{plotlyjs}
+</head>
+<body>
+<main class="block-container">
+{body}
+</main>
+<script>
+document.querySelectorAll("script[data-chart]").forEach(function (node) {{
+    var fig = JSON.parse(node.textContent);
+    Plotly.newPlot(node.dataset.chart, fig.data, fig.layout, {{responsive: true, displaylogo: false}});
+}});
+</script>
+</body>
+</html>
+"""
+
+# Stand-ins for the Streamlit layout primitives (columns, st.metric) the page relies on
+EXPORT_CSS = """
+body { margin: 0; }
+.block-container { max-width: 1200px; margin: 0 auto; padding-left: 1.5rem; padding-right: 1.5rem; }
+.tiles { display: flex; gap: 1rem; margin: 1.5rem 0; }
+.tile { flex: 1; }
+.tile-label { font-size: 0.875rem; color: #666; }
+.tile-value { font-size: 1.75rem; font-weight: 600; color: #000; }
+.tile-delta { font-size: 0.875rem; color: #00897b; }
+.tile-delta.negative { color: #c62828; }
+.levels { display: flex; gap: 1rem; }
+.levels .metric-container { flex: 1; }
+.chart { width: 100%; }
+.data-table { width: 100%; border-collapse: collapse; margin: 1rem 0; font-size: 0.9rem; }
+.data-table th, .data-table td { text-align: left; padding: 0.4rem 0.6rem; border-bottom: 1px solid #e8e8e8; }
+.coverage .sector { color: #666; font-size: 0.9rem; }
+"""
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export every STOCKS entry to static HTML.")
+    parser.add_argument("--out", default="site", help="output directory (default %(default)s)")
+    parser.add_argument("--stocks", help="registry file (default: STOCKS_FILE or stocks.json)")
+    parser.add_argument("--store", help="price store directory (default: PRICE_STORE_DIR or .price_store)")
+    parser.add_argument("--refresh", action="store_true", help="fetch new bars into the store first")
+    parser.add_argument("--force", action="store_true", help="rebuild every page")
+    parser.add_argument("--inline-plotlyjs", action="store_true", help="embed plotly.js instead of using the CDN")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    stocks = load_stocks(args.stocks) if args.stocks else load_stocks()
+    store = PriceStore(args.store) if args.store else PriceStore()
+    rebuilt = export_site(args.out, stocks, store, refresh=args.refresh, force=args.force,
+                          inline_plotlyjs=args.inline_plotlyjs)
+    log.info("%d page(s) rebuilt", len(rebuilt))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,143 @@
+"""Rolling extremes: 52-week highs/lows, Donchian channels, new-high/low flags.
+
+    High_52W / Low_52W          High.rolling(252, min_periods=1).max() / Low ... .min()
+    Donchian_High / _Low        the same over DONCHIAN_WINDOW bars
+    New_High / New_Low          High above the previous bar's High_52W (Low below
+                                its Low_52W), once a full 52-week window precedes it
+
+Windows are partial until they fill, like ``df.tail(252)``, so the last row
+equals the header's 52W tiles. ``compute_extremes`` is the batch form: every
+window spans at most two blocks of ``window`` bars, so running maxima within
+blocks from the left and from the right give all windows in O(n) numpy
+passes (1-D or days x tickers). ``ExtremesState`` keeps the same windows as
+monotonic deques, so new bars extend a series in O(1) each.
+"""
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+WEEK52 = 252
+DONCHIAN_WINDOW = 20
+# column -> (window, source column, running max or min)
+EXTREMES = {
+    "High_52W": (WEEK52, "High", np.fmax),
+    "Low_52W": (WEEK52, "Low", np.fmin),
+    "Donchian_High": (DONCHIAN_WINDOW, "High", np.fmax),
+    "Donchian_Low": (DONCHIAN_WINDOW, "Low", np.fmin),
+}
+FLAGS = ("New_High", "New_Low")
+
+
+def _sliding(values, window, ufunc):
+    # NaNs are skipped (fmax/fmin); a window with nothing but NaN stays NaN
+    values = np.asarray(values, dtype=np.float64)
+    n = values.shape[0]
+    out = np.empty(values.shape)
+    if n == 0:
+        return out
+    fill = -np.inf if ufunc is np.fmax else np.inf
+    # Padding in front makes the first windows partial; padding at the end completes the last block
+    blocks = -(-(n + window - 1) // window)
+    padded = np.full((blocks * window,) + values.shape[1:], fill)
+    padded[window - 1:window - 1 + n] = values
+    shaped = padded.reshape((blocks, window) + values.shape[1:])
+    left = ufunc.accumulate(shaped, axis=1).reshape(padded.shape)
+    right = ufunc.accumulate(shaped[:, ::-1], axis=1)[:, ::-1].reshape(padded.shape)
+    ufunc(right[:n], left[window - 1:window - 1 + n], out=out)
+    out[out == fill] = np.nan
+    return out
+
+
+def rolling_max(values, window):
+    return _sliding(values, window, np.fmax)
+
+
+def rolling_min(values, window):
+    return _sliding(values, window, np.fmin)
+
+
+def compute_extremes(high, low):
+    """Return a dict of the ``EXTREMES`` (float64) and ``FLAGS`` (bool) arrays."""
+    sources = {"High": high, "Low": low}
+    out = {name: _sliding(sources[column], window, ufunc) for name, (window, column, ufunc) in EXTREMES.items()}
+    for flag, name, column in (("New_High", "High_52W", "High"), ("New_Low", "Low_52W", "Low")):
+        values = np.asarray(sources[column], dtype=np.float64)
+        previous = out[name][WEEK52 - 1:-1]
+        out[flag] = np.zeros(values.shape, dtype=bool)
+        with np.errstate(invalid="ignore"):
+            if flag == "New_High":
+                np.greater(values[WEEK52:], previous, out=out[flag][WEEK52:])
+            else:
+                np.less(values[WEEK52:], previous, out=out[flag][WEEK52:])
+    for values in out.values():
+        values.flags.writeable = False
+    return out
+
+
+def extremes_frame(index, extremes):
+    return pd.DataFrame(extremes, index=index, copy=False)
+
+
+def rolling_extremes(df):
+    """``compute_extremes`` of a price frame, as a frame on its index."""
+    return extremes_frame(df.index, compute_extremes(df["High"].to_numpy(), df["Low"].to_numpy()))
+
+
+class ExtremesState:
+    """Streaming state for the extremes of one ticker.
+
+    Each window is a deque of (bar number, value) whose values only fall (for
+    a max) from front to back: a new bar first drops every entry it beats,
+    which can never be the extreme again, and the front leaves once it is
+    out of the window. The front is the window's extreme, and appending N
+    bars costs O(N) overall.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self._windows = {name: deque() for name in EXTREMES}
+
+    @classmethod
+    def from_history(cls, high, low):
+        """Seed a state from a full history (only the last 52 weeks are replayed)."""
+        high = np.asarray(high, dtype=np.float64)
+        low = np.asarray(low, dtype=np.float64)
+        state = cls()
+        start = max(len(high) - WEEK52, 0)
+        state.count = start
+        state.update(high[start:], low[start:])
+        return state
+
+    def _front(self, name):
+        window = self._windows[name]
+        return window[0][1] if window else np.nan
+
+    def update(self, high, low):
+        """Append new bars and return the extremes and flags for those bars."""
+        high = np.asarray(high, dtype=np.float64)
+        low = np.asarray(low, dtype=np.float64)
+        out = {name: np.empty(len(high)) for name in EXTREMES}
+        out.update((flag, np.zeros(len(high), dtype=bool)) for flag in FLAGS)
+        for j, (h, l) in enumerate(zip(high.tolist(), low.tolist())):
+            # The 52-week windows still end at the previous bar here
+            if self.count >= WEEK52:
+                out["New_High"][j] = h > self._front("High_52W")
+                out["New_Low"][j] = l < self._front("Low_52W")
+            bar = {"High": h, "Low": l}
+            for name, (window, column, ufunc) in EXTREMES.items():
+                values = self._windows[name]
+                value = bar[column]
+                if value == value:  # NaN never enters a window
+                    if ufunc is np.fmax:
+                        while values and values[-1][1] <= value:
+                            values.pop()
+                    else:
+                        while values and values[-1][1] >= value:
+                            values.pop()
+                    values.append((self.count, value))
+                while values and values[0][0] <= self.count - window:
+                    values.popleft()
+                out[name][j] = self._front(name)
+            self.count += 1
+        return out
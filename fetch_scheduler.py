@@ -0,0 +1,159 @@
+"""Background fetch scheduler for upstream data calls.
+
+Callers never sleep on the script thread. Concurrent requests for the same key
+share one in-flight call (single-flight), the last good value is served while a
+refresh runs in the background (stale-while-revalidate), and every upstream
+call first takes a token from a shared token bucket. Retries with exponential
+backoff happen on the worker threads.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+
+from series_cache import LRUCache
+
+
+class NoDataError(Exception):
+    """Raised by a fetch function when upstream returned an empty result."""
+
+
+class FetchPending(Exception):
+    """Returned when a cold key is still being fetched after the wait timeout."""
+
+
+def is_rate_limited(exc):
+    return exc is not None and ("Too Many Requests" in str(exc) or "429" in str(exc))
+
+
+def is_retryable(exc):
+    return is_rate_limited(exc) or isinstance(exc, NoDataError)
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, up to ``capacity``."""
+
+    def __init__(self, rate=1.0, capacity=5):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        # Only ever called from worker threads
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class FetchScheduler:
+    def __init__(self, ttl=3600, max_workers=4, bucket=None, max_retries=3,
+                 retry_delay=2.0, wait_timeout=20.0, retry_on=is_retryable, maxsize=128):
+        self.ttl = ttl
+        self.bucket = bucket or TokenBucket()
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.wait_timeout = wait_timeout
+        self.retry_on = retry_on
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fetch")
+        self._lock = threading.Lock()
+        self._entries = LRUCache(maxsize)  # key -> (value, fetched_at)
+        self._inflight = {}  # key -> Future
+        # Upstream call counters, reported through stats()
+        self._calls = 0
+        self._retries = 0
+        self._failures = 0
+        self._upstream_seconds = 0.0
+        self._retry_sleep_seconds = 0.0
+
+    def _run(self, key, fn):
+        delay = self.retry_delay
+        try:
+            for attempt in range(self.max_retries):
+                self.bucket.acquire()
+                start = time.monotonic()
+                try:
+                    value = fn()
+                except Exception as e:
+                    with self._lock:
+                        self._calls += 1
+                        self._upstream_seconds += time.monotonic() - start
+                    if self.retry_on(e) and attempt < self.max_retries - 1:
+                        with self._lock:
+                            self._retries += 1
+                            self._retry_sleep_seconds += delay
+                        time.sleep(delay)
+                        delay *= 2  # Exponential backoff
+                        continue
+                    with self._lock:
+                        self._failures += 1
+                    raise
+                with self._lock:
+                    self._calls += 1
+                    self._upstream_seconds += time.monotonic() - start
+                self._entries.put(key, (value, time.monotonic()))
+                return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def submit(self, key, fn):
+        """Start a fetch for ``key`` unless one is already in flight."""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._pool.submit(self._run, key, fn)
+                self._inflight[key] = future
+            return future
+
+    def prime(self, key, value):
+        """Store a value fetched elsewhere (e.g. by the pre-warmer) as fresh."""
+        self._entries.put(key, (value, time.monotonic()))
+
+    def get(self, key, fn, timeout=None):
+        """Return ``(value, error)`` for ``key``.
+
+        A cached value is returned immediately; if it is older than ``ttl`` a
+        background refresh is started. Only a cold key waits, and then at most
+        ``timeout`` seconds, on the shared in-flight call.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, fetched_at = entry
+            if time.monotonic() - fetched_at >= self.ttl:
+                self.submit(key, fn)
+            return value, None
+
+        future = self.submit(key, fn)
+        try:
+            return future.result(timeout=self.wait_timeout if timeout is None else timeout), None
+        except FutureTimeout:
+            return None, FetchPending(key)
+        except Exception as e:
+            return None, e
+
+    def stats(self):
+        """Cache counters plus upstream calls, retries, failures and the time
+        spent in upstream calls and in retry backoff."""
+        stats = self._entries.stats()
+        with self._lock:
+            stats.update(
+                calls=self._calls,
+                retries=self._retries,
+                failures=self._failures,
+                upstream_seconds=round(self._upstream_seconds, 6),
+                retry_sleep_seconds=round(self._retry_sleep_seconds, 6),
+                inflight=len(self._inflight),
+            )
+        return stats
@@ -0,0 +1,327 @@
+"""Vectorized indicator engine for the article's price metrics.
+
+All indicators are written into one preallocated float64 block in a single
+pass over the close prices. ``close`` may be 1-D (one ticker) or 2-D
+(days x tickers), in which case every column is processed at once.
+Results match the pandas expressions they replace:
+
+    Daily_Return       close.pct_change()
+    Volatility_20      Daily_Return.rolling(20).std() * sqrt(252) * 100
+    Cumulative_Return  (1 + Daily_Return).cumprod() - 1
+    MA20/MA50/MA200    close.rolling(n).mean()
+    Cumulative_Max     close.cummax()
+    Drawdown           (close - Cumulative_Max) / Cumulative_Max * 100
+"""
+import math
+import threading
+from collections import deque
+
+import numpy as np
+
+from drawdowns import drawdown_episodes
+from extremes import ExtremesState, compute_extremes, extremes_frame
+from periodic import PeriodicReturns
+from series_cache import LRUCache, frame_key
+
+INDICATORS = (
+    "Daily_Return",
+    "Volatility_20",
+    "Cumulative_Return",
+    "MA20",
+    "MA50",
+    "MA200",
+    "Cumulative_Max",
+    "Drawdown",
+)
+VOL_WINDOW = 20
+MA_WINDOWS = {"MA20": 20, "MA50": 50, "MA200": 200}
+TRADING_DAYS = 252
+# Running sums are recomputed exactly from their buffers this often, so
+# floating-point drift from add/subtract updates cannot accumulate
+RESYNC_EVERY = 4096
+
+
+def _rolling_mean(values, window, out):
+    # O(n) running-sum mean; rows before the window fills stay NaN
+    out[:window - 1] = np.nan
+    if len(values) < window:
+        out[:] = np.nan
+        return out
+    csum = np.cumsum(values, axis=0)
+    out[window - 1] = csum[window - 1]
+    out[window:] = csum[window:] - csum[:-window]
+    out[window - 1:] /= window
+    return out
+
+
+def compute_indicators(close):
+    """Return a dict of indicator arrays (views into one float64 block)."""
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    n = close.shape[0]
+    block = np.empty((len(INDICATORS),) + close.shape, dtype=np.float64)
+    out = dict(zip(INDICATORS, block))
+    if n == 0:
+        return out
+
+    ret = out["Daily_Return"]
+    ret[0] = np.nan
+    np.divide(close[1:], close[:-1], out=ret[1:])
+    ret[1:] -= 1.0
+
+    vol = out["Volatility_20"]
+    vol[:] = np.nan
+    if n > VOL_WINDOW:
+        # Running sums of (centered) returns and their squares give the
+        # rolling sample variance in O(n) without per-window temporaries
+        r = ret[1:] - np.mean(ret[1:], axis=0)
+        s1 = np.cumsum(r, axis=0)
+        s2 = np.cumsum(r * r, axis=0)
+        w = VOL_WINDOW
+        sum1 = s1[w - 1:].copy()
+        sum2 = s2[w - 1:].copy()
+        sum1[1:] -= s1[:-w]
+        sum2[1:] -= s2[:-w]
+        var = (sum2 - sum1 * sum1 / w) / (w - 1)
+        np.maximum(var, 0.0, out=var)
+        np.sqrt(var, out=vol[w:])
+        vol[w:] *= np.sqrt(TRADING_DAYS) * 100
+
+    cum = out["Cumulative_Return"]
+    cum[0] = np.nan
+    if n > 1:
+        np.cumprod(1.0 + ret[1:], axis=0, out=cum[1:])
+        cum[1:] -= 1.0
+
+    for name, window in MA_WINDOWS.items():
+        _rolling_mean(close, window, out[name])
+
+    cmax = out["Cumulative_Max"]
+    np.maximum.accumulate(close, axis=0, out=cmax)
+
+    dd = out["Drawdown"]
+    np.subtract(close, cmax, out=dd)
+    dd /= cmax
+    dd *= 100
+
+    # The views were taken before the block was locked, so each is locked too
+    block.flags.writeable = False
+    for values in out.values():
+        values.flags.writeable = False
+    return out
+
+
+class IndicatorState:
+    """Streaming state for the indicators of one ticker.
+
+    Holds the rolling-window sums (and sum of squares for volatility), the
+    running max and the running product of (1 + return), so appending N bars
+    costs O(N) and produces the same values as ``compute_indicators`` on the
+    full history.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.last_close = math.nan
+        self.growth = 1.0
+        self.running_max = -math.inf
+        self._returns = deque(maxlen=VOL_WINDOW)
+        self._ret_sum = 0.0
+        self._ret_sumsq = 0.0
+        self._size = max(MA_WINDOWS.values())
+        self._closes = [0.0] * self._size  # ring buffer of the last closes
+        self._ma_sums = dict.fromkeys(MA_WINDOWS, 0.0)
+
+    @classmethod
+    def from_history(cls, close, indicators=None):
+        """Seed a state from a full close history (and its batch indicators)."""
+        close = np.asarray(close, dtype=np.float64)
+        state = cls()
+        n = len(close)
+        if n == 0:
+            return state
+        if indicators is None:
+            indicators = compute_indicators(close)
+        state.count = n
+        state.last_close = float(close[-1])
+        state.running_max = float(indicators["Cumulative_Max"][-1])
+        if n > 1:
+            state.growth = float(indicators["Cumulative_Return"][-1]) + 1.0
+        state._returns.extend(indicators["Daily_Return"][max(1, n - VOL_WINDOW):].tolist())
+        tail = close[-state._size:].tolist()
+        for i, c in enumerate(tail):
+            state._closes[(n - len(tail) + i) % state._size] = c
+        state._resync()
+        return state
+
+    def _resync(self):
+        self._ret_sum = math.fsum(self._returns)
+        self._ret_sumsq = math.fsum(r * r for r in self._returns)
+        for name, window in MA_WINDOWS.items():
+            k = min(window, self.count)
+            self._ma_sums[name] = math.fsum(
+                self._closes[(self.count - 1 - i) % self._size] for i in range(k)
+            )
+
+    def update(self, closes):
+        """Append new closes and return the indicator values for those bars."""
+        closes = np.asarray(closes, dtype=np.float64)
+        out = {name: np.empty(len(closes)) for name in INDICATORS}
+        vol_scale = math.sqrt(TRADING_DAYS) * 100
+        for j, c in enumerate(closes.tolist()):
+            if self.count == 0:
+                r = math.nan
+                out["Cumulative_Return"][j] = math.nan
+            else:
+                r = c / self.last_close - 1.0
+                if len(self._returns) == VOL_WINDOW:
+                    old = self._returns[0]
+                    self._ret_sum -= old
+                    self._ret_sumsq -= old * old
+                self._returns.append(r)
+                self._ret_sum += r
+                self._ret_sumsq += r * r
+                self.growth *= 1.0 + r
+                out["Cumulative_Return"][j] = self.growth - 1.0
+            out["Daily_Return"][j] = r
+
+            if len(self._returns) == VOL_WINDOW:
+                var = (self._ret_sumsq - self._ret_sum * self._ret_sum / VOL_WINDOW) / (VOL_WINDOW - 1)
+                out["Volatility_20"][j] = math.sqrt(max(var, 0.0)) * vol_scale
+            else:
+                out["Volatility_20"][j] = math.nan
+
+            for name, window in MA_WINDOWS.items():
+                if self.count >= window:
+                    self._ma_sums[name] -= self._closes[(self.count - window) % self._size]
+                self._ma_sums[name] += c
+                out[name][j] = self._ma_sums[name] / window if self.count + 1 >= window else math.nan
+            self._closes[self.count % self._size] = c
+
+            if c > self.running_max:
+                self.running_max = c
+            out["Cumulative_Max"][j] = self.running_max
+            out["Drawdown"][j] = (c - self.running_max) / self.running_max * 100
+
+            self.last_close = c
+            self.count += 1
+            if self.count % RESYNC_EVERY == 0:
+                self._resync()
+        return out
+
+
+class IndicatorEngine:
+    """Memoizes indicator blocks per ticker and ``frame_key`` (first bar, last
+    bar, length and the last bar's values).
+
+    A rerun on the same data returns the cached arrays without recomputing.
+    When a series only gained bars since the last computation, the new rows
+    are produced by the ticker's ``IndicatorState`` instead of a full pass.
+    """
+
+    def __init__(self, maxsize=512):
+        self._cache = LRUCache(maxsize)
+        self._states = LRUCache(maxsize)  # (ticker, first bar) -> (state, last bar, last close, result)
+        self._episodes = LRUCache(maxsize)
+        self._periodic = LRUCache(maxsize)
+        self._extremes = LRUCache(maxsize)
+        self._extreme_states = LRUCache(maxsize)  # (ticker, first bar) -> (state, last bar, last high/low, result)
+        self._lock = threading.Lock()
+
+    def compute(self, ticker, df):
+        index = df.index
+        if len(index) == 0:
+            return compute_indicators(df["Close"].to_numpy())
+        key = (ticker, frame_key(df))
+        result = self._cache.get(key)
+        if result is None:
+            with self._lock:
+                result = self._extend_or_compute(ticker, index, df["Close"].to_numpy())
+            self._cache.put(key, result)
+        return result
+
+    def _extend_or_compute(self, ticker, index, close):
+        state_key = (ticker, index[0])
+        entry = self._states.get(state_key)
+        if entry is not None:
+            state, last_bar, last_close, previous = entry
+            n_prev = state.count
+            # Only extend when the old series is an unchanged prefix of the new one
+            if n_prev < len(index) and index[n_prev - 1] == last_bar and close[n_prev - 1] == last_close:
+                new_rows = state.update(close[n_prev:])
+                block = np.empty((len(INDICATORS), len(close)), dtype=np.float64)
+                result = dict(zip(INDICATORS, block))
+                for name in INDICATORS:
+                    result[name][:n_prev] = previous[name]
+                    result[name][n_prev:] = new_rows[name]
+                block.flags.writeable = False
+                for values in result.values():
+                    values.flags.writeable = False
+                self._states.put(state_key, (state, index[-1], close[-1], result))
+                return result
+
+        result = compute_indicators(close)
+        state = IndicatorState.from_history(close, result)
+        self._states.put(state_key, (state, index[-1], close[-1], result))
+        return result
+
+    def _derived(self, cache, ticker, df, build):
+        # Memoized on the same key as ``compute``
+        index = df.index
+        key = (ticker, frame_key(df)) if len(index) else None
+        value = cache.get(key) if key else None
+        if value is None:
+            value = build(self.compute(ticker, df))
+            if key:
+                cache.put(key, value)
+        return value
+
+    def drawdowns(self, ticker, df):
+        """Drawdown episodes of ``df``."""
+        return self._derived(self._episodes, ticker, df,
+                             lambda result: drawdown_episodes(df.index, result["Drawdown"]))
+
+    def periodic(self, ticker, df):
+        """``PeriodicReturns`` (weekly to yearly) of ``df``."""
+        return self._derived(self._periodic, ticker, df,
+                             lambda result: PeriodicReturns(df.index, result["Daily_Return"]))
+
+    def extremes(self, ticker, df):
+        """Rolling extremes of ``df`` (see ``extremes``), as a frame; like
+        ``compute``, a series that only gained bars is extended from the
+        ticker's ``ExtremesState``."""
+        index = df.index
+        if len(index) == 0:
+            return extremes_frame(index, compute_extremes(df["High"].to_numpy(), df["Low"].to_numpy()))
+        key = (ticker, frame_key(df))
+        frame = self._extremes.get(key)
+        if frame is None:
+            with self._lock:
+                result = self._extend_or_compute_extremes(ticker, index, df["High"].to_numpy(), df["Low"].to_numpy())
+            frame = extremes_frame(index, result)
+            self._extremes.put(key, frame)
+        return frame
+
+    def _extend_or_compute_extremes(self, ticker, index, high, low):
+        state_key = (ticker, index[0])
+        entry = self._extreme_states.get(state_key)
+        if entry is not None:
+            state, last_bar, last_values, previous = entry
+            n_prev = state.count
+            # Only extend when the old series is an unchanged prefix of the new one
+            if (n_prev < len(index) and index[n_prev - 1] == last_bar
+                    and (high[n_prev - 1], low[n_prev - 1]) == last_values):
+                new_rows = state.update(high[n_prev:], low[n_prev:])
+                result = {}
+                for name, values in new_rows.items():
+                    result[name] = np.concatenate([previous[name], values])
+                    result[name].flags.writeable = False
+                self._extreme_states.put(state_key, (state, index[-1], (high[-1], low[-1]), result))
+                return result
+
+        result = compute_extremes(high, low)
+        state = ExtremesState.from_history(high, low)
+        self._extreme_states.put(state_key, (state, index[-1], (high[-1], low[-1]), result))
+        return result
+
+    def stats(self):
+        return self._cache.stats()
@@ -0,0 +1,154 @@
+"""Hot-path instrumentation: stage timers, counters and their export.
+
+``Metrics`` is a process-wide registry of counters and stage timers, plus
+collectors that report the ``stats()`` of the caches and fetch schedulers
+when it is read. ``RunTrace`` times the stages of one page run: each stage
+is added to the registry, kept for the on-page debug panel and written as a
+structured (JSON) log line on the ``instrumentation`` logger.
+
+``prometheus_text()`` renders the registry in the Prometheus text format,
+and ``start_metrics_server`` serves it on ``/metrics`` from a daemon thread.
+"""
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+log = logging.getLogger("instrumentation")
+
+PREFIX = "finance_blog"
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"') for _, v in labels)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(labels, escaped)) + "}"
+
+
+class Metrics:
+    def __init__(self, prefix=PREFIX):
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._counters = {}    # (name, labels) -> value
+        self._timers = {}      # (name, labels) -> [count, sum, max]
+        self._collectors = {}  # source -> callable returning {stat: number}
+
+    def inc(self, name, value=1, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, seconds, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            timer = self._timers.setdefault(key, [0, 0.0, 0.0])
+            timer[0] += 1
+            timer[1] += seconds
+            timer[2] = max(timer[2], seconds)
+
+    def register(self, source, collect):
+        """Report ``collect()`` (e.g. an ``LRUCache.stats``) as gauges labelled ``source``."""
+        with self._lock:
+            self._collectors[source] = collect
+
+    def collect(self):
+        with self._lock:
+            collectors = list(self._collectors.items())
+        out = {}
+        for source, collect in collectors:
+            try:
+                out[source] = collect()
+            except Exception:
+                log.exception("metrics collector %s failed", source)
+        return out
+
+    def prometheus_text(self):
+        with self._lock:
+            counters = sorted(self._counters.items())
+            timers = sorted(self._timers.items())
+        lines = []
+        typed = set()
+
+        def emit(name, kind, labels, value):
+            if name not in typed:
+                lines.append(f"# TYPE {name} {kind}")
+                typed.add(name)
+            lines.append(f"{name}{_format_labels(labels)} {value}")
+
+        for (name, labels), value in counters:
+            emit(f"{self.prefix}_{name}_total", "counter", labels, value)
+        for (name, labels), (count, total, _) in timers:
+            base = f"{self.prefix}_{name}_seconds"
+            if base not in typed:
+                lines.append(f"# TYPE {base} summary")
+                typed.add(base)
+            lines.append(f"{base}_count{_format_labels(labels)} {count}")
+            lines.append(f"{base}_sum{_format_labels(labels)} {total:.6f}")
+        for (name, labels), (_, _, peak) in timers:
+            emit(f"{self.prefix}_{name}_seconds_max", "gauge", labels, f"{peak:.6f}")
+        for source, stats in sorted(self.collect().items()):
+            for stat, value in sorted(stats.items()):
+                if isinstance(value, (int, float)):
+                    emit(f"{self.prefix}_{stat}", "gauge", (("source", source),), value)
+        return "\n".join(lines) + "\n"
+
+
+class RunTrace:
+    """Stage timings of one run, for the debug panel and the log."""
+
+    def __init__(self, metrics=None, **context):
+        self.metrics = metrics
+        self.context = context
+        self.stages = []  # (stage, labels, seconds)
+
+    @contextmanager
+    def stage(self, name, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stages.append((name, labels, elapsed))
+            if self.metrics is not None:
+                self.metrics.observe("stage", elapsed, stage=name, **labels)
+            if log.isEnabledFor(logging.INFO):
+                log.info(json.dumps({"stage": name, "seconds": round(elapsed, 6), **labels, **self.context},
+                                    default=str))
+
+    def total(self):
+        return sum(seconds for _, _, seconds in self.stages)
+
+    def rows(self):
+        """One dict per stage, slowest first."""
+        rows = [{"stage": name, **labels, "ms": round(seconds * 1000, 2)} for name, labels, seconds in self.stages]
+        return sorted(rows, key=lambda row: -row["ms"])
+
+
+def start_metrics_server(metrics, port, host="0.0.0.0"):
+    """Serve ``metrics.prometheus_text()`` on ``/metrics`` from a daemon thread."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.prometheus_text().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            log.debug("metrics request: " + format, *args)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
@@ -0,0 +1,196 @@
+"""Scalar metrics shown on the article page, and their tile formatting.
+
+``df`` is a price frame that already carries the indicator columns. Both the
+Streamlit page and the static exporter render the tiles from here, so the
+two always show the same numbers.
+"""
+import pandas as pd
+
+import risk
+from periodic import PeriodicReturns
+
+# Support/resistance: percentiles of the lows/highs over the last LEVEL_WINDOW bars
+LEVEL_WINDOW = 90
+RESISTANCE_Q = 0.90
+SUPPORT_Q = 0.10
+
+
+def headline_metrics(df):
+    close = df["Close"]
+    # Prices may be stored as float32; changes are taken in float64
+    first, last = float(close.iloc[0]), float(close.iloc[-1])
+    df_52w = df.tail(252)
+    return {
+        "current_price": last,
+        "price_change": last - first,
+        "pct_change": (last - first) / first * 100,
+        "high_52w": df_52w["High"].max(),
+        "low_52w": df_52w["Low"].min(),
+        "avg_volume": df["Volume"].mean(),
+    }
+
+
+def level_metrics(df, window=LEVEL_WINDOW, resistance_q=RESISTANCE_Q, support_q=SUPPORT_Q):
+    last = float(df["Close"].iloc[-1])
+    recent_data = df.tail(window)
+    resistance = recent_data["High"].quantile(resistance_q)
+    support = recent_data["Low"].quantile(support_q)
+    return {
+        "resistance": resistance,
+        "support": support,
+        "dist_resistance": (last / resistance - 1) * 100,
+        "dist_support": (last / support - 1) * 100,
+    }
+
+
+def rolling_levels(df, window=LEVEL_WINDOW, resistance_q=RESISTANCE_Q, support_q=SUPPORT_Q):
+    """Support/resistance over time: the ``level_metrics`` snapshot evaluated
+    at every bar, NaN until the first full window.
+
+    pandas keeps each window in an indexable skiplist, so every step is an
+    O(log window) insert/remove rather than a re-sort, and it interpolates
+    linearly like ``Series.quantile`` - the last row equals the snapshot.
+    """
+    return pd.DataFrame({
+        "Resistance": df["High"].rolling(window).quantile(resistance_q),
+        "Support": df["Low"].rolling(window).quantile(support_q),
+    }, index=df.index)
+
+
+def volume_metrics(df):
+    return {
+        "avg_volume": df["Volume"].mean(),
+        "current_volatility": df["Volatility_20"].iloc[-1],
+        "peak_volatility": df["Volatility_20"].max(),
+    }
+
+
+def return_metrics(df):
+    returns = df["Daily_Return"]
+    return {
+        "total_return": df["Cumulative_Return"].iloc[-1] * 100,
+        "best_day": returns.max() * 100,
+        "worst_day": returns.min() * 100,
+        "avg_daily_return": returns.mean() * 100,
+    }
+
+
+def risk_metrics(df):
+    r = risk.risk_metrics(df["Daily_Return"].to_numpy())
+    return {
+        "max_drawdown": df["Drawdown"].min(),
+        "sharpe_ratio": r["sharpe"],
+        "daily_std": r["std"] * 100,
+        "downside_std": r["downside_std"] * 100,
+        "sortino_ratio": r["sortino"],
+        "calmar_ratio": r["calmar"],
+        "var_95": r["var"] * 100,
+        "cvar_95": r["cvar"] * 100,
+        "parametric_var_95": r["parametric_var"] * 100,
+    }
+
+
+def article_metrics(df):
+    """Every metric on the page; the live page computes each section's group lazily."""
+    m = {}
+    for group in (headline_metrics, level_metrics, volume_metrics, return_metrics, risk_metrics):
+        m.update(group(df))
+    return m
+
+
+# Tile rows: lists of (label, value, delta)
+
+def header_tiles(m):
+    return [
+        ("Current Price", f"${m['current_price']:.2f}", None),
+        ("Period Change", f"{m['pct_change']:.2f}%", f"${m['price_change']:.2f}"),
+        ("52W High", f"${m['high_52w']:.2f}", None),
+        ("52W Low", f"${m['low_52w']:.2f}", None),
+        ("Avg Volume", f"{m['avg_volume']/1e6:.2f}M", None),
+    ]
+
+
+def volume_tiles(m):
+    return [
+        ("Average Daily Volume", f"{m['avg_volume']:,.0f}", None),
+        ("Current Volatility", f"{m['current_volatility']:.2f}%", None),
+        ("Peak Volatility", f"{m['peak_volatility']:.2f}%", None),
+    ]
+
+
+def return_tiles(m):
+    return [
+        ("Total Return", f"{m['total_return']:.2f}%", None),
+        ("Best Single Day", f"{m['best_day']:.2f}%", None),
+        ("Worst Single Day", f"{m['worst_day']:.2f}%", None),
+        ("Avg Daily Return", f"{m['avg_daily_return']:.3f}%", None),
+    ]
+
+
+def risk_tiles(m):
+    return [
+        ("Maximum Drawdown", f"{m['max_drawdown']:.2f}%", None),
+        ("Sharpe Ratio", f"{m['sharpe_ratio']:.2f}", None),
+        ("Daily Std Dev", f"{m['daily_std']:.2f}%", None),
+        ("Downside Deviation", f"{m['downside_std']:.2f}%", None),
+    ]
+
+
+def tail_risk_tiles(m):
+    return [
+        ("Sortino Ratio", f"{m['sortino_ratio']:.2f}", None),
+        ("Calmar Ratio", f"{m['calmar_ratio']:.2f}", None),
+        ("1-Day VaR (95%)", f"{m['var_95']:.2f}%", None),
+        ("1-Day CVaR (95%)", f"{m['cvar_95']:.2f}%", None),
+    ]
+
+
+def episode_tiles(stats):
+    return [
+        ("Time Underwater", f"{stats['underwater_pct']:.1f}%", None),
+        ("Longest Drawdown", f"{stats['longest_days']:,} days", None),
+        ("Current Drawdown", f"{stats['current_days']:,} days" if stats["current_days"] else "At peak", None),
+        ("Drawdown Episodes", f"{stats['episodes']:,}", None),
+    ]
+
+
+def episode_rows(episodes):
+    """Display rows (column -> text) for a drawdown episode table."""
+    return [
+        {
+            "Peak": row.peak.strftime("%Y-%m-%d"),
+            "Trough": row.trough.strftime("%Y-%m-%d"),
+            "Recovery": "Ongoing" if pd.isna(row.recovery) else row.recovery.strftime("%Y-%m-%d"),
+            "Depth": f"{row.depth:.2f}%",
+            "Days to Trough": f"{(row.trough - row.peak).days:,}",
+            "Days Underwater": f"{row.underwater_days:,}",
+        }
+        for row in episodes.itertuples()
+    ]
+
+
+def comparison_rows(summary):
+    """Display rows for ``peers.Comparison.summary()``."""
+    return [
+        {
+            "Comparison": row["name"],
+            "Total Return": f"{row['total_return']:.2f}%",
+            "Excess Return": f"{row['excess_return']:+.2f}%",
+            "Correlation": f"{row['correlation']:.2f}",
+            "Beta": f"{row['beta']:.2f}",
+        }
+        for row in summary
+    ]
+
+
+def monthly_return_pivot(df):
+    """Monthly compounded returns (%) as a months x years table."""
+    return PeriodicReturns(df.index, df["Daily_Return"].to_numpy()).monthly_pivot()
+
+
+def calendar_rows(table):
+    """Display rows for ``PeriodicReturns.calendar_table()``, latest year first."""
+    return [
+        {"Year": str(year), **{column: "" if pd.isna(value) else f"{value:.2f}%" for column, value in row.items()}}
+        for year, row in table.iloc[::-1].iterrows()
+    ]
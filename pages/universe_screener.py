@@ -0,0 +1,69 @@
+import streamlit as st
+import os
+
+from article import ANALYSIS_START
+from price_store import PriceStore
+from screener import Screener
+from stock_registry import load_stocks, tickers
+
+st.set_page_config(page_title="Universe Screener", layout="wide", page_icon="📊")
+st.markdown('<link rel="stylesheet" href="app/static/editorial.css">', unsafe_allow_html=True)
+
+# SCREENER_WORKERS caps the scoring pool (default: every core)
+SCREENER_WORKERS = int(os.environ.get("SCREENER_WORKERS", "0")) or None
+
+# Scores come from the local price store only - the pre-warmer keeps it current, so this page never goes upstream
+@st.cache_resource
+def get_screener():
+    return Screener(PriceStore(), workers=SCREENER_WORKERS)
+
+# Column, label and display format, in table order; the same definitions as the article's tiles
+COLUMNS = [
+    ("last_close", "Price", "$%.2f"),
+    ("pct_change", "Period Change", "%.2f%%"),
+    ("range_position", "52W Range Position", "%.1f%%"),
+    ("current_volatility", "Volatility (20D)", "%.2f%%"),
+    ("max_drawdown", "Max Drawdown", "%.2f%%"),
+    ("sharpe_ratio", "Sharpe Ratio", "%.2f"),
+    ("dist_resistance", "To Resistance", "%.2f%%"),
+    ("dist_support", "To Support", "%.2f%%"),
+]
+
+STOCKS = load_stocks()
+by_ticker = {entry["ticker"]: entry for entry in STOCKS.values()}
+
+st.markdown('<div class="main-title">Universe Screener</div>', unsafe_allow_html=True)
+st.markdown(f'<div class="subtitle">{len(by_ticker)} covered stocks ranked on the article\'s metrics, '
+            f'from January 2024 to the last stored bar</div>', unsafe_allow_html=True)
+
+labels = {column: label for column, label, _ in COLUMNS}
+left, middle, right = st.columns([2, 2, 1])
+rank_by = left.selectbox("Rank by", options=[column for column, _, _ in COLUMNS[1:]], format_func=labels.get)
+# The scan: tickers whose last bar set a new 52-week high/low (the markers on each page's price chart)
+SCANS = {"All stocks": None, "New 52W high today": "new_high", "New 52W low today": "new_low"}
+scan = middle.selectbox("Show", options=list(SCANS))
+ascending = right.toggle("Lowest first", value=False)
+
+screener = get_screener()
+with st.spinner("Scoring the universe..."):
+    table, missing = screener.screen(tickers(STOCKS), ANALYSIS_START)
+
+if table.empty:
+    st.info("No stored price data yet. The pre-warmer fills the store after the close (or run `python prewarm.py --once`).")
+else:
+    if SCANS[scan]:
+        table = table[table[SCANS[scan]]]
+    # Numbers stay numeric (formatted by column_config) so header clicks still sort by value
+    ranked = table.sort_values(rank_by, ascending=ascending, na_position="last").reset_index()
+    ranked.insert(0, "Rank", range(1, len(ranked) + 1))
+    ranked.insert(2, "Stock", [by_ticker[t]["name"] for t in ranked["ticker"]])
+    ranked.insert(3, "Sector", [by_ticker[t]["sector"] for t in ranked["ticker"]])
+    ranked["last_bar"] = ranked["last_bar"].dt.strftime("%Y-%m-%d")
+    config = {column: st.column_config.NumberColumn(label, format=fmt) for column, label, fmt in COLUMNS}
+    config.update(ticker="Ticker", last_bar="Last Bar", new_high=st.column_config.CheckboxColumn("New 52W High"),
+                  new_low=st.column_config.CheckboxColumn("New 52W Low"))
+    st.dataframe(ranked, column_config=config, hide_index=True, use_container_width=True)
+    st.caption(f"Scored in {screener.last_seconds * 1000:.0f} ms; cached until new bars are stored.")
+
+if missing:
+    st.caption(f"No stored data yet for: {', '.join(missing)}")
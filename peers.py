@@ -0,0 +1,148 @@
+"""Benchmark and peer comparison on an aligned date x ticker matrix.
+
+``aligned_matrix`` lines several price series up on their session dates with
+one scatter into a preallocated block (no pairwise merges); a missing bar is
+NaN. Relative performance, rolling correlation and rolling beta are then
+computed for every comparison column at once with running sums, the same
+way the indicator block is.
+"""
+import numpy as np
+import pandas as pd
+
+from series_cache import LRUCache, frame_key
+
+NS_PER_DAY = 86_400 * 10**9
+ROLLING_WINDOW = 63
+
+
+def _session_days(index):
+    # Daily bars are stamped at local midnight; key them by local calendar day
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.asi8 // NS_PER_DAY
+
+
+def aligned_matrix(frames, column="Close"):
+    """``(dates, names, matrix)`` for ``{name: frame}``, one column per name."""
+    names = list(frames)
+    if not names:
+        return pd.DatetimeIndex([]), names, np.empty((0, 0))
+    days = [_session_days(frames[name].index) for name in names]
+    all_days = np.concatenate(days)
+    cols = np.repeat(np.arange(len(names)), [len(d) for d in days])
+    values = np.concatenate([frames[name][column].to_numpy(dtype=np.float64) for name in names])
+
+    dates, rows = np.unique(all_days, return_inverse=True)
+    matrix = np.full((len(dates), len(names)), np.nan)
+    matrix[rows, cols] = values
+    return pd.to_datetime(dates * NS_PER_DAY), names, matrix
+
+
+def matrix_returns(matrix):
+    """Simple returns per column; NaN on the first row and around gaps."""
+    out = np.full(matrix.shape, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(matrix[1:], matrix[:-1], out=out[1:])
+    out[1:] -= 1.0
+    return out
+
+
+def relative_performance(matrix):
+    """Growth of every column since the first date all columns have a price."""
+    complete = np.flatnonzero(~np.isnan(matrix).any(axis=1))
+    out = np.full(matrix.shape, np.nan)
+    if len(complete) == 0:
+        return out
+    base = complete[0]
+    out[base:] = matrix[base:] / matrix[base] - 1.0
+    return out
+
+
+def pair_stats(returns, target=0, window=ROLLING_WINDOW):
+    """Correlation and beta of column ``target`` against every column.
+
+    With ``window`` the result is rolling (NaN until a window holds
+    ``window`` days on which both series have a return); with ``window=None``
+    it is one value per column over the whole period. Beta is
+    cov(target, column) / var(column).
+    """
+    a = returns[:, [target]]
+    both = ~np.isnan(a) & ~np.isnan(returns)
+    # Centering keeps the running sums of products well conditioned
+    with np.errstate(invalid="ignore"):
+        x = np.where(both, a - np.nanmean(a), 0.0)
+        y = np.where(both, returns - np.nan_to_num(np.nanmean(np.where(both, returns, np.nan), axis=0)), 0.0)
+    sums = [both.astype(np.float64), x, y, x * y, x * x, y * y]
+    if window is None:
+        n, sx, sy, sxy, sxx, syy = (s.sum(axis=0) for s in sums)
+    else:
+        if len(returns) < window:
+            nan = np.full(returns.shape, np.nan)
+            return nan, nan.copy()
+        pad = np.zeros((1, returns.shape[1]))
+        running = [np.concatenate([pad, np.cumsum(s, axis=0)]) for s in sums]
+        n, sx, sy, sxy, sxx, syy = (c[window:] - c[:-window] for c in running)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = sxy - sx * sy / n
+        var_x = sxx - sx * sx / n
+        var_y = syy - sy * sy / n
+        corr = cov / np.sqrt(var_x * var_y)
+        beta = cov / var_y
+    if window is not None:
+        full = n == window
+        pad = np.full((window - 1, returns.shape[1]), np.nan)
+        corr = np.concatenate([pad, np.where(full, corr, np.nan)])
+        beta = np.concatenate([pad, np.where(full, beta, np.nan)])
+    return corr, beta
+
+
+class Comparison:
+    """Aligned closes of a stock (column 0) and its comparisons, with the
+    derived relative-performance and rolling statistics."""
+
+    def __init__(self, frames, window=ROLLING_WINDOW):
+        self.dates, self.names, self.closes = aligned_matrix(frames)
+        self.returns = matrix_returns(self.closes)
+        self.growth = relative_performance(self.closes)
+        self.correlation, self.beta = pair_stats(self.returns, 0, window)
+        self.window = window
+
+    def summary(self):
+        """One row per comparison: total returns, excess return, correlation and beta."""
+        corr, beta = pair_stats(self.returns, 0, None)
+        # Returns are read on the last date both the stock and the comparison have a
+        # price, so a series that is a day behind is not reported as NaN
+        both = ~np.isnan(self.growth[:, [0]]) & ~np.isnan(self.growth)
+        rows = []
+        for j, name in enumerate(self.names[1:], 1):
+            dates = np.flatnonzero(both[:, j])
+            stock, other = self.growth[dates[-1], [0, j]] if len(dates) else (np.nan, np.nan)
+            rows.append({
+                "name": name,
+                "total_return": float(other * 100),
+                "excess_return": float((stock - other) * 100),
+                "correlation": float(corr[j]),
+                "beta": float(beta[j]),
+            })
+        return rows
+
+
+class ComparisonCache:
+    """Comparisons keyed on every series' name and ``frame_key``, so a
+    corrected last bar on any of them builds a new comparison."""
+
+    def __init__(self, maxsize=64, window=ROLLING_WINDOW):
+        self._cache = LRUCache(maxsize)
+        self.window = window
+
+    def get(self, frames):
+        key = tuple((name, frame_key(df)) for name, df in frames.items() if len(df))
+        comparison = self._cache.get(key)
+        if comparison is None:
+            comparison = Comparison({name: df for name, df in frames.items() if len(df)}, self.window)
+            self._cache.put(key, comparison)
+        return comparison
+
+    def stats(self):
+        return self._cache.stats()
@@ -0,0 +1,79 @@
+"""Compounded weekly, monthly, quarterly and yearly returns.
+
+Bars are grouped by calendar period with integer arithmetic on the session
+dates. Since the bars are in time order every period is a contiguous run,
+so a period's compounded return is one ``np.add.reduceat`` over
+``log1p(returns)`` and no Python callback runs per group. ``returns`` may be
+1-D or 2-D (days x tickers); a NaN return (the first bar, or a day with no
+data) counts as flat.
+"""
+import numpy as np
+import pandas as pd
+
+NS_PER_DAY = 86_400 * 10**9
+PERIODS = ("W", "M", "Q", "Y")
+QUARTERS = ["Q1", "Q2", "Q3", "Q4"]
+
+
+def period_keys(index, period):
+    """Integer key per bar, equal within a calendar period and increasing."""
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    if period == "W":
+        # 1970-01-01 was a Thursday; shifting by 3 days makes weeks run Monday-Sunday
+        return (index.asi8 // NS_PER_DAY + 3) // 7
+    year = index.year.to_numpy().astype(np.int64)
+    month = index.month.to_numpy().astype(np.int64)
+    if period == "M":
+        return year * 12 + month - 1
+    if period == "Q":
+        return year * 4 + (month - 1) // 3
+    if period == "Y":
+        return year
+    raise ValueError(f"unknown period {period!r}, expected one of {PERIODS}")
+
+
+def period_returns(index, returns, period="M"):
+    """``(period_end, values)``: each period's compounded return (a fraction)
+    and the date of its last bar."""
+    index = pd.DatetimeIndex(index)
+    r = np.asarray(returns, dtype=np.float64)
+    if len(index) == 0:
+        return index, r[:0]
+    keys = period_keys(index, period)
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    logs = np.log1p(np.where(np.isnan(r), 0.0, r))
+    values = np.expm1(np.add.reduceat(logs, starts, axis=0))
+    ends = np.r_[starts[1:], len(index)] - 1
+    return index[ends], values
+
+
+class PeriodicReturns:
+    """All ``PERIODS`` of one return series, computed once."""
+
+    def __init__(self, index, returns):
+        self.index = pd.DatetimeIndex(index)
+        self.returns = {period: period_returns(self.index, returns, period) for period in PERIODS}
+
+    def monthly_pivot(self):
+        """Monthly returns in percent, months (1-12) as rows and years as columns."""
+        ends, values = self.returns["M"]
+        years = ends.year.to_numpy()
+        columns = np.unique(years)
+        pivot = np.full((12, len(columns)), np.nan)
+        pivot[ends.month.to_numpy() - 1, np.searchsorted(columns, years)] = values * 100
+        present = ~np.isnan(pivot).all(axis=1)
+        return pd.DataFrame(pivot[present], index=pd.Index(np.arange(1, 13)[present], name="Month"),
+                            columns=pd.Index(columns, name="Year"))
+
+    def calendar_table(self):
+        """Quarterly returns plus the full year, in percent, one row per year."""
+        ends, values = self.returns["Q"]
+        years = ends.year.to_numpy()
+        rows = np.unique(years)
+        table = np.full((len(rows), 4), np.nan)
+        table[np.searchsorted(rows, years), ends.quarter.to_numpy() - 1] = values * 100
+        frame = pd.DataFrame(table, index=pd.Index(rows, name="Year"), columns=QUARTERS)
+        year_ends, year_values = self.returns["Y"]
+        frame["Full Year"] = pd.Series(year_values * 100, index=year_ends.year.to_numpy())
+        return frame
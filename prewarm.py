@@ -0,0 +1,189 @@
+"""Cache pre-warmer: refreshes every covered ticker on a schedule.
+
+Run it as a standalone process next to the app (it fills the shared on-disk
+price store)::
+
+    python prewarm.py --once
+    python prewarm.py --at 16:30 --tz America/New_York
+
+or start it inside the app process with ``start_background_prewarmer``, where
+an ``on_refresh`` callback can also prime the in-memory caches. Given a
+``SharedCache``, only one replica refreshes at a time and the refreshed
+series are published there for the others.
+"""
+import argparse
+import logging
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from price_store import DEFAULT_STORE_DIR, PriceStore, YFinanceProvider, frame_to_bytes
+from shared_cache import SharedCache, open_backend
+from stock_registry import load_stocks, tickers
+
+log = logging.getLogger("prewarm")
+
+MARKET_TZ = "America/New_York"
+REFRESH_AT = "16:30"  # after the US close, once the daily bar is final
+# How long one replica's refresh may hold the shared lease before another can take over
+PREWARM_LEASE = 900
+
+
+def next_run_time(now=None, at=REFRESH_AT, tz=MARKET_TZ):
+    """Next occurrence of ``at`` (HH:MM, local to ``tz``) strictly after ``now``."""
+    zone = ZoneInfo(tz)
+    now = datetime.now(zone) if now is None else now.astimezone(zone)
+    hour, minute = (int(part) for part in at.split(":"))
+    run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if run <= now:
+        run += timedelta(days=1)
+    return run
+
+
+class Prewarmer:
+    def __init__(self, store=None, provider=None, load_tickers=None, on_refresh=None,
+                 batch_size=50, max_workers=4, bucket=None, history=50, shared=None, shared_ttl=3600):
+        self.store = store or PriceStore()
+        self.provider = provider or YFinanceProvider()
+        self.load_tickers = load_tickers or (lambda: tickers(load_stocks(), comparisons=True))
+        self.on_refresh = on_refresh
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.bucket = bucket
+        self.shared = shared
+        self.shared_ttl = shared_ttl
+        self.runs = deque(maxlen=history)  # recent refresh records, newest last
+        self._stop = threading.Event()
+
+    def run_once(self, max_age=None):
+        """Refresh every ticker once (except those refreshed less than
+        ``max_age`` seconds ago) and return the run record."""
+        if self.shared is None:
+            return self._refresh(max_age)
+        with self.shared.lease(("prewarm",), PREWARM_LEASE) as held:
+            if held:
+                return self._refresh(max_age)
+        log.info("another replica is pre-warming, skipping this run")
+        record = {"started_at": time.time(), "tickers": 0, "refreshed": 0, "failed": 0, "fetch_seconds": 0.0,
+                  "total_seconds": 0.0, "error": None, "skipped": True}
+        self.runs.append(record)
+        return record
+
+    def _refresh(self, max_age=None):
+        names = self.load_tickers()
+        started = time.time()
+        t0 = time.perf_counter()
+        error = None
+        frames = {}
+        try:
+            frames = self.store.update_many(
+                names, self.provider, batch_size=self.batch_size,
+                max_workers=self.max_workers, bucket=self.bucket, max_age=max_age,
+            )
+        except Exception as e:
+            error = str(e)
+            log.exception("pre-warm refresh failed")
+        fetch_seconds = time.perf_counter() - t0
+
+        interval = getattr(self.provider, "interval", "1d")
+        for ticker, df in frames.items():
+            if df is None or df.empty:
+                continue
+            if self.shared is not None:
+                self.shared.put(("history", ticker, interval), df, self.shared_ttl, frame_to_bytes)
+            if self.on_refresh is not None:
+                try:
+                    self.on_refresh(ticker, df)
+                except Exception:
+                    log.exception("on_refresh failed for %s", ticker)
+
+        record = {
+            "started_at": started,
+            "tickers": len(names),
+            "refreshed": sum(1 for df in frames.values() if df is not None and not df.empty),
+            # Tickers upstream did not answer for keep their old data and age
+            "failed": len(names) - len(frames),
+            "fetch_seconds": round(fetch_seconds, 3),
+            "total_seconds": round(time.perf_counter() - t0, 3),
+            "error": error,
+            "skipped": False,
+        }
+        self.runs.append(record)
+        log.info(
+            "pre-warmed %d/%d tickers (%d failed) in %.2fs (fetch %.2fs)", record["refreshed"],
+            record["tickers"], record["failed"], record["total_seconds"], record["fetch_seconds"],
+        )
+        return record
+
+    def run_forever(self, at=REFRESH_AT, tz=MARKET_TZ, every=None, run_now=True):
+        """Refresh on a schedule until ``stop()``: every ``every`` seconds if
+        given, otherwise daily at ``at`` in ``tz``."""
+        if run_now:
+            # On a restart, skip tickers already refreshed since the last scheduled run
+            if every is not None:
+                since_last = every
+            else:
+                now = datetime.now(ZoneInfo(tz))
+                since_last = (now - (next_run_time(now, at, tz) - timedelta(days=1))).total_seconds()
+            self.run_once(max_age=since_last)
+        while not self._stop.is_set():
+            if every is not None:
+                delay = every
+            else:
+                delay = (next_run_time(at=at, tz=tz) - datetime.now(ZoneInfo(tz))).total_seconds()
+            if self._stop.wait(max(delay, 0)):
+                break
+            self.run_once()
+
+    def stop(self):
+        self._stop.set()
+
+
+def start_background_prewarmer(prewarmer, **schedule):
+    """Run ``prewarmer.run_forever`` on a daemon thread and return the thread."""
+    thread = threading.Thread(
+        target=prewarmer.run_forever, kwargs=schedule, name="prewarm", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-warm the price store for every ticker in STOCKS.")
+    parser.add_argument("--once", action="store_true", help="refresh once and exit")
+    parser.add_argument("--at", default=REFRESH_AT, help="daily refresh time, HH:MM (default %(default)s)")
+    parser.add_argument("--tz", default=MARKET_TZ, help="timezone for --at (default %(default)s)")
+    parser.add_argument("--every", type=float, help="refresh every N seconds instead of daily")
+    parser.add_argument("--stocks", help="registry file (default: STOCKS_FILE or stocks.json)")
+    parser.add_argument("--store", help="price store directory (default: PRICE_STORE_DIR or .price_store)")
+    parser.add_argument("--shared-cache", help="cache to publish refreshed series to, as the app's SHARED_CACHE"
+                                               " (default: SHARED_CACHE or shared_cache.sqlite in the store; 'off')")
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    store = PriceStore(args.store) if args.store else PriceStore()
+    load_tickers = (lambda: tickers(load_stocks(args.stocks), comparisons=True)) if args.stocks else None
+    spec = args.shared_cache or os.environ.get("SHARED_CACHE",
+                                               os.path.join(args.store or DEFAULT_STORE_DIR, "shared_cache.sqlite"))
+    shared = SharedCache(open_backend(spec)) if spec != "off" else None
+    # Published for as long as the app trusts a pre-warmed store (its STORE_MAX_AGE)
+    prewarmer = Prewarmer(store, load_tickers=load_tickers, batch_size=args.batch_size, max_workers=args.workers,
+                          shared=shared, shared_ttl=26 * 3600)
+
+    if args.once:
+        record = prewarmer.run_once()
+        return 1 if record["error"] else 0
+    try:
+        prewarmer.run_forever(at=args.at, tz=args.tz, every=args.every)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,325 @@
+"""Local OHLCV price store with incremental (delta) fetches.
+
+Each ticker is kept as a single structured ``.npy`` file (one record per bar)
+plus a small JSON sidecar holding the index timezone. The file is opened
+memory-mapped, so reading a partition costs no more than the columns used.
+Only bars from the last stored session onward are requested from the
+provider. That session comes back with the delta, so it doubles as a check
+that upstream has not re-adjusted the history (splits and dividends rescale
+every earlier price); if it has, the partition is downloaded again in full.
+Loaded frames use the compact dtypes from ``compact`` (float32 prices where
+they round-trip, uint32 volume).
+"""
+import io
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from compact import COLUMNS, PRICE_COLUMNS, CompactSeries, compact_columns
+
+RECORD_DTYPE = np.dtype([("ts", "<i8")] + [(c, "<f8") for c in PRICE_COLUMNS] + [("Volume", "<i8")])
+
+DEFAULT_STORE_DIR = os.environ.get("PRICE_STORE_DIR", ".price_store")
+# A re-fetched session's open moving by more than this (relative) means upstream re-adjusted the history
+ADJUSTMENT_TOLERANCE = 1e-4
+
+
+class YFinanceProvider:
+    """Default provider backed by yfinance. Any object with the same
+    ``history`` signature can be passed to ``PriceStore.update`` instead."""
+
+    def __init__(self, period="2y", interval="1d"):
+        self.period = period
+        self.interval = interval
+
+    def history(self, ticker, start=None):
+        import yfinance as yf
+
+        stock = yf.Ticker(ticker)
+        if start is None:
+            return stock.history(period=self.period, interval=self.interval)
+        return stock.history(start=start, interval=self.interval)
+
+    def history_many(self, tickers, start=None):
+        """Fetch several tickers in one upstream request; returns {ticker: frame}
+        for the tickers that came back with data."""
+        import yfinance as yf
+
+        kwargs = {"period": self.period} if start is None else {"start": start}
+        data = yf.download(
+            list(tickers), interval=self.interval, group_by="ticker", auto_adjust=True,
+            actions=False, ignore_tz=False, threads=False, progress=False, **kwargs
+        )
+        frames = {}
+        for ticker in tickers:
+            if isinstance(data.columns, pd.MultiIndex):
+                if ticker not in data.columns.get_level_values(0):
+                    continue
+                frame = data[ticker]
+            else:
+                frame = data
+            frame = frame.dropna(how="all")
+            if not frame.empty:
+                frames[ticker] = frame
+        return frames
+
+
+class PriceStore:
+    def __init__(self, root=DEFAULT_STORE_DIR):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def _paths(self, ticker, interval="1d"):
+        safe = ticker.upper().replace("/", "_")
+        if interval != "1d":
+            safe = f"{safe}_{interval}"
+        base = os.path.join(self.root, safe)
+        return base + ".npy", base + ".json"
+
+    def _read_records(self, ticker, interval="1d"):
+        data_path, _ = self._paths(ticker, interval)
+        if not os.path.exists(data_path):
+            return None
+        return np.load(data_path, mmap_mode="r")
+
+    def _read_meta(self, ticker, interval="1d"):
+        _, meta_path = self._paths(ticker, interval)
+        if not os.path.exists(meta_path):
+            return {}
+        with open(meta_path) as f:
+            return json.load(f)
+
+    def _atomic_write(self, path, write):
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def last_timestamp(self, ticker, interval="1d"):
+        records = self._read_records(ticker, interval)
+        if records is None or len(records) == 0:
+            return None
+        tz = self._read_meta(ticker, interval).get("tz")
+        return pd.Timestamp(int(records["ts"][-1]), tz="UTC").tz_convert(tz)
+
+    def load(self, ticker, interval="1d"):
+        """Return the stored history as a DataFrame, or None if nothing is stored."""
+        records = self._read_records(ticker, interval)
+        if records is None:
+            return None
+        return _records_to_frame(records, self._read_meta(ticker, interval).get("tz"))
+
+    def load_records(self, ticker, interval="1d"):
+        """``(records, tz)``: the memory-mapped record array and index timezone,
+        for bulk readers that skip building a frame; None if nothing is stored."""
+        records = self._read_records(ticker, interval)
+        if records is None:
+            return None
+        return records, self._read_meta(ticker, interval).get("tz")
+
+    def version(self, ticker, interval="1d"):
+        """Changes whenever the stored bars do (one ``stat``); None if nothing is stored."""
+        data_path, _ = self._paths(ticker, interval)
+        try:
+            st = os.stat(data_path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def load_compact(self, ticker, interval="1d"):
+        """Return the stored history as a ``CompactSeries``, or None."""
+        df = self.load(ticker, interval)
+        return None if df is None else CompactSeries.from_frame(df)
+
+    def write(self, ticker, df, interval="1d"):
+        """Replace the stored partition for ``ticker`` with ``df``."""
+        records = _frame_to_records(df)
+        tz = str(df.index.tz) if df.index.tz is not None else None
+        data_path, meta_path = self._paths(ticker, interval)
+        self._atomic_write(data_path, lambda f: np.save(f, records))
+        self._write_meta(ticker, interval, {"tz": tz, "rows": int(len(records))})
+
+    def drop(self, ticker, interval="1d"):
+        """Delete the stored partition for ``ticker``."""
+        for path in self._paths(ticker, interval):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def adjusted_since(self, ticker, delta, interval="1d"):
+        """True if ``delta`` (fetched from the last stored session) shows the
+        stored bars were re-adjusted upstream. The session's open is compared:
+        unlike its close it is final even when the stored bar was partial."""
+        records = self._read_records(ticker, interval)
+        if records is None or len(records) == 0 or delta is None or delta.empty:
+            return False
+        first = _frame_to_records(_align_tz(delta.iloc[:1], self._read_meta(ticker, interval).get("tz")))
+        if first["ts"][0] != records["ts"][-1]:
+            return False
+        stored, fetched = float(records["Open"][-1]), float(first["Open"][0])
+        return not np.isclose(fetched, stored, rtol=ADJUSTMENT_TOLERANCE, atol=0)
+
+    def _write_meta(self, ticker, interval, meta):
+        _, meta_path = self._paths(ticker, interval)
+        payload = json.dumps(dict(meta, updated_at=time.time())).encode()
+        self._atomic_write(meta_path, lambda f: f.write(payload))
+
+    def age(self, ticker, interval="1d"):
+        """Seconds since ``ticker`` was last refreshed from upstream, or None."""
+        updated_at = self._read_meta(ticker, interval).get("updated_at")
+        return None if updated_at is None else time.time() - updated_at
+
+    def append(self, ticker, new_df, interval="1d"):
+        """Merge ``new_df`` into the stored partition. Stored bars at or after the
+        first new timestamp are replaced, so a partial last bar gets corrected."""
+        if new_df is None or new_df.empty:
+            # A delta always re-requests the last stored session, so an empty answer means
+            # upstream failed: leave updated_at alone and the ticker is tried again
+            return self.load(ticker, interval)
+        existing = self.load(ticker, interval)
+        new_df = new_df[list(COLUMNS)]
+        if existing is not None and not existing.empty:
+            new_df = _align_tz(new_df, existing.index.tz)
+            existing = existing[existing.index < new_df.index[0]]
+            merged = pd.concat([existing, new_df])
+        else:
+            merged = new_df
+        merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+        self.write(ticker, merged, interval)
+        # Same dtypes as a later load() would give
+        return _compact_frame(merged, merged.index)
+
+    def update(self, ticker, provider, max_age=None):
+        """Bring ``ticker`` up to date and return its full stored history.
+
+        On a cold store the provider's default window is fetched; afterwards
+        only bars from the last stored session onward are requested. If the
+        partition was refreshed less than ``max_age`` seconds ago (e.g. by the
+        pre-warmer) it is returned without contacting the provider.
+        """
+        interval = getattr(provider, "interval", "1d")
+        if max_age is not None:
+            age = self.age(ticker, interval)
+            if age is not None and age < max_age:
+                return self.load(ticker, interval)
+        last = self.last_timestamp(ticker, interval)
+        if last is None:
+            return self.append(ticker, provider.history(ticker), interval)
+        delta = provider.history(ticker, start=last.strftime("%Y-%m-%d"))
+        if self.adjusted_since(ticker, delta, interval):
+            # A split or dividend rescaled the stored bars: replace them with a fresh full download
+            full = provider.history(ticker)
+            if full is None or full.empty:
+                # Keep the old (consistent) history rather than splice rescaled bars onto it
+                return self.load(ticker, interval)
+            self.drop(ticker, interval)
+            return self.append(ticker, full, interval)
+        return self.append(ticker, delta, interval)
+
+    def update_many(self, tickers, provider, batch_size=50, max_workers=4, bucket=None, max_age=None):
+        """Bring many tickers up to date with batched upstream requests.
+
+        Tickers refreshed less than ``max_age`` seconds ago are loaded as they
+        are. The rest are grouped by the date they need data from (cold
+        tickers together), each group is split into batches of ``batch_size``
+        and batches run on at most ``max_workers`` threads. If ``bucket`` is
+        given every batch takes one token from it first. Returns {ticker:
+        frame}; tickers upstream did not answer for are left out.
+        """
+        interval = getattr(provider, "interval", "1d")
+        results = {}
+        groups = {}
+        for ticker in tickers:
+            if max_age is not None:
+                age = self.age(ticker, interval)
+                if age is not None and age < max_age:
+                    results[ticker] = self.load(ticker, interval)
+                    continue
+            last = self.last_timestamp(ticker, interval)
+            start = None if last is None else last.strftime("%Y-%m-%d")
+            groups.setdefault(start, []).append(ticker)
+
+        batches = [
+            (start, group[i:i + batch_size])
+            for start, group in groups.items()
+            for i in range(0, len(group), batch_size)
+        ]
+
+        def run(batch):
+            start, names = batch
+            if bucket is not None:
+                bucket.acquire()
+            fetched = provider.history_many(names, start=start)
+            adjusted = [name for name in names if self.adjusted_since(name, fetched.get(name), interval)]
+            if adjusted:
+                # Re-adjusted upstream (split/dividend): their full history again, in one more request
+                if bucket is not None:
+                    bucket.acquire()
+                full = provider.history_many(adjusted)
+                for name in adjusted:
+                    if name in full:
+                        self.drop(name, interval)
+                        fetched[name] = full[name]
+                    else:
+                        del fetched[name]
+            return {name: self.append(name, fetched[name], interval) for name in names if name in fetched}
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bulk") as pool:
+            for frames in pool.map(run, batches):
+                results.update(frames)
+        return results
+
+
+def _align_tz(df, tz):
+    if df.index.tz is None and tz is not None:
+        return df.tz_localize(tz)
+    if df.index.tz is not None and tz is None:
+        return df.tz_convert("UTC").tz_localize(None)
+    if df.index.tz is not None:
+        return df.tz_convert(tz)
+    return df
+
+
+def _frame_to_records(df):
+    index = df.index
+    if index.tz is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+    records = np.empty(len(df), dtype=RECORD_DTYPE)
+    records["ts"] = index.as_unit("ns").asi8
+    for col in PRICE_COLUMNS:
+        records[col] = df[col].to_numpy(dtype="f8")
+    records["Volume"] = df["Volume"].to_numpy(dtype="i8")
+    return records
+
+
+def frame_to_bytes(df):
+    """A frame in the store's record layout as ``.npz`` bytes (no pickle), for shared caches."""
+    buf = io.BytesIO()
+    tz = str(df.index.tz) if df.index.tz is not None else ""
+    np.savez(buf, records=_frame_to_records(df), tz=np.array(tz))
+    return buf.getvalue()
+
+
+def frame_from_bytes(data):
+    with np.load(io.BytesIO(data), allow_pickle=False) as f:
+        return _records_to_frame(f["records"], str(f["tz"]) or None)
+
+
+def _records_to_frame(records, tz):
+    index = pd.DatetimeIndex(pd.to_datetime(np.asarray(records["ts"]), unit="ns"), name="Date")
+    if tz is not None:
+        index = index.tz_localize("UTC").tz_convert(tz)
+    return _compact_frame(records, index)
+
+
+def _compact_frame(columns, index):
+    return pd.DataFrame(compact_columns({col: columns[col] for col in COLUMNS}), index=index)
@@ -0,0 +1,149 @@
+"""Batched risk metrics over a return array.
+
+``returns`` are simple daily returns, 1-D (one ticker) or 2-D (days x
+tickers). NaN marks days without a return (the first bar, or dates before a
+ticker listed), so a whole coverage universe with different histories can be
+scored in one call. Results are fractions (not percent); 1-D input gives
+scalars, 2-D input one value per column.
+
+All metrics share the sums taken in one pass over the filled return block:
+
+    sharpe              mean / std * sqrt(periods)
+    sortino             mean / semideviation below 0 * sqrt(periods)
+    calmar              annualized growth / |max drawdown|
+    var / cvar          historical Value-at-Risk and expected shortfall at ``level``
+    parametric_var/cvar the same under a normal fit to mean and std
+    beta                cov(returns, benchmark) / var(benchmark)
+"""
+import warnings
+from statistics import NormalDist
+
+import numpy as np
+
+TRADING_DAYS = 252
+VAR_LEVEL = 0.95
+ROLLING_WINDOWS = (63, 252)
+
+
+def _div(a, b, default=np.nan):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.true_divide(a, b)
+    return np.where(b != 0, out, default)
+
+
+def _nan_reduce(reduce, r, *args, **kwargs):
+    # Columns with no returns at all reduce to NaN without the all-NaN warning
+    if len(r) == 0:
+        return np.full(r.shape[1], np.nan)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return reduce(r, *args, **kwargs)
+
+
+def _as_block(returns):
+    r = np.asarray(returns, dtype=np.float64)
+    return r[:, None] if r.ndim == 1 else r, r.ndim == 1
+
+
+def risk_metrics(returns, benchmark=None, level=VAR_LEVEL, periods=TRADING_DAYS):
+    """Return a dict of per-ticker risk metrics (see the module docstring).
+
+    ``std`` is the sample standard deviation of daily returns and
+    ``downside_std`` that of the negative days only, both annualized except
+    ``std``. ``benchmark`` is a 1-D return array on the same dates.
+    """
+    r, squeeze = _as_block(returns)
+    valid = ~np.isnan(r)
+    n = valid.sum(axis=0)
+    x = np.where(valid, r, 0.0)
+
+    s1 = x.sum(axis=0)
+    s2 = np.einsum("ij,ij->j", x, x)
+    mean = _div(s1, n)
+    std = np.sqrt(np.maximum(_div(s2 - s1 * mean, n - 1), 0.0))
+
+    # Negative days: their own spread (the downside deviation tile) and the
+    # semideviation below zero that Sortino divides by
+    neg = np.minimum(x, 0.0)
+    neg_n = (x < 0).sum(axis=0)
+    d1 = neg.sum(axis=0)
+    d2 = np.einsum("ij,ij->j", neg, neg)
+    downside_std = np.sqrt(np.maximum(_div(d2 - d1 * _div(d1, neg_n, 0.0), neg_n - 1, 0.0), 0.0))
+    semidev = np.sqrt(_div(d2, n))
+
+    # Growth of 1 and its drawdown; missing days count as flat
+    if len(x):
+        wealth = np.cumprod(1.0 + x, axis=0)
+        max_dd = (wealth / np.maximum.accumulate(wealth, axis=0) - 1.0).min(axis=0)
+        cagr = np.where(n > 0, np.power(wealth[-1], _div(periods, n)) - 1.0, np.nan)
+    else:
+        max_dd = cagr = np.full(r.shape[1], np.nan)
+
+    # Historical VaR/CVaR: the loss at the (1 - level) quantile and the mean loss beyond it
+    q = _nan_reduce(np.nanquantile, r, 1.0 - level, axis=0)
+    tail = x <= q
+    tail &= valid
+    cvar = -_div(np.where(tail, x, 0.0).sum(axis=0), tail.sum(axis=0))
+
+    normal = NormalDist()
+    z = normal.inv_cdf(1.0 - level)
+    out = {
+        "observations": n,
+        "mean": mean,
+        "std": std,
+        "downside_std": downside_std * np.sqrt(periods),
+        "sharpe": _div(mean, std, 0.0) * np.sqrt(periods),
+        "sortino": _div(mean, semidev) * np.sqrt(periods),
+        "max_drawdown": max_dd,
+        "cagr": cagr,
+        "calmar": _div(cagr, -max_dd),
+        "var": -q,
+        "cvar": cvar,
+        "parametric_var": -(mean + z * std),
+        "parametric_cvar": -(mean - std * normal.pdf(z) / (1.0 - level)),
+    }
+
+    if benchmark is not None:
+        b = np.asarray(benchmark, dtype=np.float64)[:, None]
+        both = valid & ~np.isnan(b)
+        k = both.sum(axis=0)
+        bx = np.where(both, b, 0.0)
+        rx = np.where(both, x, 0.0)
+        b1 = bx.sum(axis=0)
+        cov = np.einsum("ij,ij->j", rx, bx) - rx.sum(axis=0) * _div(b1, k, 0.0)
+        var_b = np.einsum("ij,ij->j", bx, bx) - b1 * _div(b1, k, 0.0)
+        out["beta"] = _div(cov, var_b)
+
+    if squeeze:
+        out = {name: value[0] for name, value in out.items()}
+    return out
+
+
+def rolling_sharpe(returns, window, periods=TRADING_DAYS):
+    """Annualized Sharpe over each trailing ``window`` of returns (O(n) running
+    sums); NaN until a window holds ``window`` valid returns."""
+    r, squeeze = _as_block(returns)
+    out = np.full(r.shape, np.nan)
+    if len(r) < window:
+        return out[:, 0] if squeeze else out
+    valid = ~np.isnan(r)
+    # Centering on the column mean keeps the running variance sums well conditioned
+    center = np.nan_to_num(_nan_reduce(np.nanmean, r, axis=0))
+    x = np.where(valid, r - center, 0.0)
+    zero = np.zeros((1, r.shape[1]))
+    c0 = np.concatenate([zero, np.cumsum(valid, axis=0)])
+    c1 = np.concatenate([zero, np.cumsum(x, axis=0)])
+    c2 = np.concatenate([zero, np.cumsum(x * x, axis=0)])
+
+    count = c0[window:] - c0[:-window]
+    s1 = c1[window:] - c1[:-window]
+    s2 = c2[window:] - c2[:-window]
+    var = np.maximum((s2 - s1 * s1 / window) / (window - 1), 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = (s1 / window + center) / np.sqrt(var) * np.sqrt(periods)
+    out[window - 1:] = np.where((count == window) & (var > 0), sharpe, np.nan)
+    return out[:, 0] if squeeze else out
+
+
+def rolling_sharpes(returns, windows=ROLLING_WINDOWS, periods=TRADING_DAYS):
+    return {window: rolling_sharpe(returns, window, periods) for window in windows}
@@ -0,0 +1,198 @@
+"""Universe screener: the article's headline metrics for every covered ticker.
+
+Each ticker's window is scored with the definitions the article page uses
+(``metrics``, ``risk``, ``indicators``, ``extremes``), so a screener row
+matches the numbers on that ticker's page; ``new_high``/``new_low`` flag the
+tickers whose last bar set a new 52-week high/low, like the chart's markers.
+
+Large universes are split into chunks scored on a process pool: the
+High/Low/Close arrays are packed once into one shared-memory block (a row
+per field, tickers back to back), which workers map instead of receiving
+pickled frames; they are filled straight from the store's record files,
+without building a frame per ticker. A finished screen is cached on every
+ticker's stored file version, so it is only recomputed once new bars land.
+"""
+import os
+import threading
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, shared_memory
+
+import numpy as np
+import pandas as pd
+
+import risk
+from compact import PRICE_COLUMNS, price_dtype
+from extremes import WEEK52, compute_extremes
+from indicators import compute_indicators
+from metrics import LEVEL_WINDOW, RESISTANCE_Q, SUPPORT_Q
+from series_cache import LRUCache
+
+SCREEN_COLUMNS = (
+    "last_close", "pct_change", "range_position", "current_volatility",
+    "max_drawdown", "sharpe_ratio", "dist_resistance", "dist_support", "new_high", "new_low",
+)
+FLAG_COLUMNS = ("new_high", "new_low")
+FIELDS = ("High", "Low", "Close")
+# Below this many tickers the pool costs more than it saves
+PARALLEL_MIN = 64
+CHUNKS_PER_WORKER = 4
+
+
+def _quantile(values, q):
+    # Series.quantile semantics (NaN skipped, linear interpolation) without nanquantile's per-call overhead
+    values = values[~np.isnan(values)]
+    return np.quantile(values, q) if len(values) else np.nan
+
+
+def score_arrays(high, low, close, offsets):
+    """``SCREEN_COLUMNS`` for tickers packed back to back, ticker ``i`` being
+    ``offsets[i]:offsets[i + 1]``; one float64 row per ticker."""
+    n = len(offsets) - 1
+    out = np.full((n, len(SCREEN_COLUMNS)), np.nan)
+    lengths = np.diff(offsets)
+    # Returns right-aligned in a NaN-padded block, so Sharpe is one batched call
+    returns = np.full((int(lengths.max()) if n else 0, n), np.nan)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        for i in range(n):
+            lo, hi = offsets[i], offsets[i + 1]
+            if hi == lo:
+                continue
+            c = close[lo:hi]
+            indicators = compute_indicators(c)
+            last = c[-1]
+            # The last bar of the page's rolling extremes only needs the year before it
+            year = slice(max(lo, hi - WEEK52 - 1), hi)
+            extremes = compute_extremes(high[year], low[year])
+            high_52w, low_52w = extremes["High_52W"][-1], extremes["Low_52W"][-1]
+            recent = slice(max(lo, hi - LEVEL_WINDOW), hi)
+            resistance = _quantile(high[recent], RESISTANCE_Q)
+            support = _quantile(low[recent], SUPPORT_Q)
+            out[i] = (
+                last,
+                (last - c[0]) / c[0] * 100,
+                (last - low_52w) / (high_52w - low_52w) * 100 if high_52w > low_52w else np.nan,
+                indicators["Volatility_20"][-1],
+                np.nanmin(indicators["Drawdown"]),
+                np.nan,
+                (last / resistance - 1) * 100,
+                (last / support - 1) * 100,
+                extremes["New_High"][-1],
+                extremes["New_Low"][-1],
+            )
+            returns[len(returns) - (hi - lo):, i] = indicators["Daily_Return"]
+    out[:, SCREEN_COLUMNS.index("sharpe_ratio")] = risk.risk_metrics(returns)["sharpe"]
+    return out
+
+
+def _score_chunk(name, total, offsets):
+    # Runs in a pool worker: map the shared block and score this chunk's tickers
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        block = np.ndarray((len(FIELDS), total), dtype=np.float64, buffer=shm.buf)
+        lo, hi = offsets[0], offsets[-1]
+        out = score_arrays(block[0, lo:hi], block[1, lo:hi], block[2, lo:hi], offsets - lo)
+        del block
+        return out
+    finally:
+        shm.close()
+
+
+class Screener:
+    """Scores tickers from a ``PriceStore``; ``workers`` processes (default:
+    every core) take chunks once a universe reaches ``parallel_min`` tickers."""
+
+    def __init__(self, store, workers=None, parallel_min=PARALLEL_MIN, maxsize=8):
+        self.store = store
+        self.workers = workers or os.cpu_count() or 1
+        self.parallel_min = parallel_min
+        self._cache = LRUCache(maxsize)
+        self._lock = threading.Lock()
+        self._pool = None
+        self.screens = 0
+        self.last_seconds = 0.0
+
+    def _executor(self):
+        # Spawned, not forked: the app process runs threads
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.workers, mp_context=get_context("spawn"))
+        return self._pool
+
+    def start(self):
+        """Spawn every worker now rather than during the first large screen."""
+        list(self._executor().map(time.sleep, [0.1] * self.workers))
+
+    def screen(self, tickers, start=None):
+        """``(table, missing)``: ``SCREEN_COLUMNS`` plus ``last_bar`` (the last
+        bar's local date, tz-naive) indexed by ticker, and the tickers with no
+        stored bars in the window."""
+        versions = {ticker: self.store.version(ticker) for ticker in tickers}
+        key = (start, tuple(versions.items()))
+        entry = self._cache.get(key)
+        if entry is None:
+            # One screen at a time; sessions asking for the same one get it from the cache after
+            with self._lock:
+                entry = self._cache.get(key) if key in self._cache else None
+                if entry is None:
+                    entry = self._compute([t for t in tickers if versions[t] is not None], start)
+                    self._cache.put(key, entry)
+        table, empty = entry
+        return table, [t for t in tickers if versions[t] is None] + empty
+
+    def _compute(self, tickers, start):
+        t0 = time.perf_counter()
+        windows = {}
+        for ticker in tickers:
+            loaded = self.store.load_records(ticker)
+            if loaded is None:
+                continue
+            records, tz = loaded
+            # Stored timestamps are UTC; the window starts at local midnight like slice_window
+            lo = 0 if start is None else np.searchsorted(records["ts"], pd.Timestamp(start, tz=tz).value)
+            if lo < len(records):
+                # Rounded to the dtype PriceStore.load gives, so rows match the ticker's page
+                windows[ticker] = (records[lo:], tz, price_dtype(*(records[name] for name in PRICE_COLUMNS)))
+        names = list(windows)
+        offsets = np.concatenate([[0], np.cumsum([len(windows[name][0]) for name in names])]).astype(np.int64)
+        total = int(offsets[-1])
+
+        if len(names) < self.parallel_min or self.workers == 1:
+            block = np.empty((len(FIELDS), total))
+            values = score_arrays(*self._pack(windows, offsets, block), offsets)
+        else:
+            shm = shared_memory.SharedMemory(create=True, size=max(len(FIELDS) * total * 8, 1))
+            try:
+                block = np.ndarray((len(FIELDS), total), dtype=np.float64, buffer=shm.buf)
+                self._pack(windows, offsets, block)
+                del block
+                size = -(-len(names) // (self.workers * CHUNKS_PER_WORKER))
+                bounds = [offsets[i:i + size + 1] for i in range(0, len(names), size)]
+                parts = self._executor().map(_score_chunk, [shm.name] * len(bounds), [total] * len(bounds), bounds)
+                values = np.concatenate(list(parts))
+            finally:
+                shm.close()
+                shm.unlink()
+
+        table = pd.DataFrame(values, index=pd.Index(names, name="ticker"), columns=list(SCREEN_COLUMNS))
+        table = table.astype(dict.fromkeys(FLAG_COLUMNS, bool))
+        # Local session dates, without the timezone: a universe mixing exchanges still gets one datetime column
+        table["last_bar"] = pd.DatetimeIndex([
+            pd.Timestamp(int(records["ts"][-1]), tz="UTC").tz_convert(tz).tz_localize(None)
+            for records, tz, _ in windows.values()
+        ], dtype="datetime64[ns]")
+        self.screens += 1
+        self.last_seconds = time.perf_counter() - t0
+        return table, [t for t in tickers if t not in windows]
+
+    @staticmethod
+    def _pack(windows, offsets, block):
+        for i, (records, _, dtype) in enumerate(windows.values()):
+            for row, field in enumerate(FIELDS):
+                block[row, offsets[i]:offsets[i + 1]] = records[field].astype(dtype)
+        return block
+
+    def stats(self):
+        return dict(self._cache.stats(), screens=self.screens, last_seconds=round(self.last_seconds, 6),
+                    workers=self.workers)
@@ -0,0 +1,133 @@
+"""Bounded LRU caches for price series and the date windows sliced from them.
+
+One full series is held per (ticker, interval). Requested windows are keyed on
+a canonical range, where any end date at or after today means "open ended", so
+a new calendar day does not create a new cache entry.
+"""
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from compact import COLUMNS
+
+
+class LRUCache:
+    """Thread-safe LRU mapping with hit/miss/eviction counters."""
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None, valid=None):
+        """Return the cached value, counting a hit or a miss. Entries for which
+        ``valid(value)`` is false are dropped and count as a miss."""
+        with self._lock:
+            if key in self._data:
+                value = self._data[key]
+                if valid is None or valid(value):
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+    def values(self):
+        """Snapshot of the cached values, without touching recency or counters."""
+        with self._lock:
+            return list(self._data.values())
+
+    def stats(self):
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def canonical_range(start=None, end=None, today=None):
+    """Normalize a requested window to ``(start_date, end_date)`` strings.
+
+    ``end`` values of today or later collapse to None (open ended).
+    """
+    today = pd.Timestamp.today().normalize() if today is None else pd.Timestamp(today).normalize()
+    start = pd.Timestamp(start).normalize().strftime("%Y-%m-%d") if start is not None else None
+    if end is not None:
+        end = pd.Timestamp(end).normalize()
+        end = None if end >= today else end.strftime("%Y-%m-%d")
+    return start, end
+
+
+def frame_key(df):
+    """Memo key for the data in ``df``: first bar, last bar, length and the
+    raw bytes of the last bar's OHLCV values. ``PriceStore.update`` rewrites
+    a partial last bar in place, so a same-day correction changes the key
+    even though the dates and length do not."""
+    index = df.index
+    if not len(index):
+        return None
+    last = b"".join(df[name].to_numpy()[-1:].tobytes() for name in COLUMNS if name in df.columns)
+    return (index[0], index[-1], len(index), last)
+
+
+def slice_window(df, start=None, end=None):
+    """Slice ``df`` (sorted DatetimeIndex) to the inclusive date range [start, end]."""
+    index = df.index
+    tz = index.tz
+    lo = 0 if start is None else index.searchsorted(pd.Timestamp(start, tz=tz), side="left")
+    if end is None:
+        hi = len(index)
+    else:
+        hi = index.searchsorted(pd.Timestamp(end, tz=tz) + pd.Timedelta(days=1), side="left")
+    return df.iloc[lo:hi]
+
+
+class WindowCache:
+    """Windows sliced out of the shared per-ticker series.
+
+    Entries remember which series object they were cut from, so a refreshed
+    series invalidates them without any explicit bookkeeping.
+    """
+
+    def __init__(self, maxsize=256):
+        self._cache = LRUCache(maxsize)
+
+    def get(self, series, ticker, interval, start=None, end=None):
+        key = (ticker, interval) + canonical_range(start, end)
+        entry = self._cache.get(key, valid=lambda e: e[0] is series)
+        if entry is not None:
+            return entry[1]
+        window = slice_window(series, key[2], key[3])
+        self._cache.put(key, (series, window))
+        return window
+
+    def stats(self):
+        return self._cache.stats()
@@ -0,0 +1,245 @@
+"""Cache shared by every app replica, so one replica's upstream fetch serves all.
+
+Backends store bytes under string keys with a TTL, and hand out leases: named
+locks with an expiry, so a replica that dies mid-fetch cannot block the others
+for longer than the lease.
+
+- ``SQLiteBackend`` (default): one database file on local disk, e.g. next to
+  the price store. Same-host replicas only: WAL mode needs shared memory,
+  which network filesystems (NFS, SMB) do not provide.
+- ``RedisBackend``: any Redis-compatible server, through the optional
+  ``redis`` package. Use it when replicas run on more than one host.
+- ``MemoryBackend``: in-process, with the same semantics; a stand-in for the
+  others in benchmarks and single-process runs.
+
+``SharedCache.fetch`` reads through a backend. On a miss one replica takes the
+key's lease and fetches; the rest poll until its value lands. Values are
+encoded by the caller (``price_store.frame_to_bytes`` for price frames),
+never pickled.
+"""
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+log = logging.getLogger("shared_cache")
+
+LEASE_TTL = 60.0
+POLL_INTERVAL = 0.2
+
+
+class MemoryBackend:
+    def __init__(self):
+        self._entries = {}  # key -> (value, expires)
+        self._leases = {}   # key -> (owner, expires)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.time():
+                return None
+            return entry[0]
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (bytes(value), time.time() + ttl)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def acquire(self, key, owner, ttl):
+        with self._lock:
+            lease = self._leases.get(key)
+            if lease is not None and lease[1] > time.time():
+                return False
+            self._leases[key] = (owner, time.time() + ttl)
+            return True
+
+    def release(self, key, owner):
+        with self._lock:
+            if self._leases.get(key, (None,))[0] == owner:
+                del self._leases[key]
+
+
+class SQLiteBackend:
+    """Entries and leases in one SQLite file (WAL mode, one connection per thread)."""
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._local = threading.local()
+        db = self._db()
+        db.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB, expires REAL)")
+        db.execute("CREATE TABLE IF NOT EXISTS leases (key TEXT PRIMARY KEY, owner TEXT, expires REAL)")
+
+    def _db(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            self._local.db = db
+        return db
+
+    def get(self, key):
+        row = self._db().execute(
+            "SELECT value FROM entries WHERE key = ? AND expires > ?", (key, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key, value, ttl):
+        now = time.time()
+        db = self._db()
+        db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?)", (key, sqlite3.Binary(value), now + ttl))
+        db.execute("DELETE FROM entries WHERE expires <= ?", (now,))
+
+    def delete(self, key):
+        self._db().execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def acquire(self, key, owner, ttl):
+        # One statement, so taking a free or expired lease is atomic across processes
+        now = time.time()
+        cursor = self._db().execute(
+            "INSERT INTO leases VALUES (?, ?, ?) ON CONFLICT(key) DO UPDATE"
+            " SET owner = excluded.owner, expires = excluded.expires WHERE leases.expires <= ?",
+            (key, owner, now + ttl, now),
+        )
+        return cursor.rowcount == 1
+
+    def release(self, key, owner):
+        self._db().execute("DELETE FROM leases WHERE key = ? AND owner = ?", (key, owner))
+
+
+class RedisBackend:
+    # Delete the lease only if this owner still holds it
+    RELEASE = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) end return 0"
+
+    def __init__(self, client):
+        self.client = client
+
+    @classmethod
+    def from_url(cls, url):
+        import redis
+
+        return cls(redis.Redis.from_url(url))
+
+    def get(self, key):
+        return self.client.get(key)
+
+    def set(self, key, value, ttl):
+        self.client.set(key, value, px=max(int(ttl * 1000), 1))
+
+    def delete(self, key):
+        self.client.delete(key)
+
+    def acquire(self, key, owner, ttl):
+        return bool(self.client.set(key, owner, nx=True, px=max(int(ttl * 1000), 1)))
+
+    def release(self, key, owner):
+        self.client.eval(self.RELEASE, 1, key, owner)
+
+
+def open_backend(spec):
+    """Backend for a ``SHARED_CACHE`` value: ``memory``, ``redis://...`` or an SQLite path."""
+    if spec == "memory":
+        return MemoryBackend()
+    if spec.startswith(("redis://", "rediss://", "unix://")):
+        return RedisBackend.from_url(spec)
+    return SQLiteBackend(spec)
+
+
+class SharedCache:
+    def __init__(self, backend, namespace="finance_blog", lease_ttl=LEASE_TTL, poll=POLL_INTERVAL):
+        self.backend = backend
+        self.namespace = namespace
+        self.lease_ttl = lease_ttl
+        self.poll = poll
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(("hits", "misses", "fetches", "waits", "lease_timeouts", "errors"), 0)
+
+    def _count(self, name):
+        with self._lock:
+            self._counts[name] += 1
+
+    def _key(self, key):
+        return ":".join([self.namespace] + [str(part) for part in key])
+
+    def _get(self, name, decode):
+        # A backend outage degrades to fetching directly, never to a failed page
+        try:
+            data = self.backend.get(name)
+        except Exception:
+            self._count("errors")
+            log.warning("shared cache read failed for %s", name, exc_info=True)
+            return None
+        return None if data is None else decode(data)
+
+    def put(self, key, value, ttl, encode):
+        try:
+            self.backend.set(self._key(key), encode(value), ttl)
+        except Exception:
+            self._count("errors")
+            log.warning("shared cache write failed for %s", self._key(key), exc_info=True)
+
+    @contextmanager
+    def lease(self, key, ttl=LEASE_TTL):
+        """Hold ``key``'s lease for the block if no other replica does;
+        yields whether it was taken (never waits)."""
+        name = self._key(key) + ":lease"
+        try:
+            held = self.backend.acquire(name, self.owner, ttl)
+        except Exception:
+            self._count("errors")
+            log.warning("shared cache lease failed for %s", name, exc_info=True)
+            held = True  # without a backend there is nobody to defer to
+        try:
+            yield held
+        finally:
+            if held:
+                try:
+                    self.backend.release(name, self.owner)
+                except Exception:
+                    self._count("errors")
+
+    def fetch(self, key, fetch, ttl, encode, decode, wait=None):
+        """Return the shared value for ``key``, calling ``fetch()`` in at most
+        one replica at a time. Waits up to ``wait`` seconds (default: the lease
+        TTL) for another replica's fetch before fetching itself."""
+        name = self._key(key)
+        value = self._get(name, decode)
+        if value is not None:
+            self._count("hits")
+            return value
+        self._count("misses")
+
+        deadline = time.monotonic() + (self.lease_ttl if wait is None else wait)
+        while True:
+            with self.lease(key, self.lease_ttl) as held:
+                if held:
+                    # Another replica may have published while this one waited
+                    value = self._get(name, decode)
+                    if value is not None:
+                        self._count("waits")
+                        return value
+                    value = fetch()
+                    self._count("fetches")
+                    self.put(key, value, ttl, encode)
+                    return value
+            if time.monotonic() >= deadline:
+                self._count("lease_timeouts")
+                return fetch()
+            time.sleep(self.poll)
+            value = self._get(name, decode)
+            if value is not None:
+                self._count("waits")
+                return value
+
+    def stats(self):
+        with self._lock:
+            return dict(self._counts, backend=type(self.backend).__name__)
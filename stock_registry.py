@@ -0,0 +1,95 @@
+"""Coverage registry: the STOCKS mapping, loaded from a JSON or CSV file.
+
+JSON files hold the same mapping the app used to hard-code::
+
+    {"ASTS": {"name": "AST SpaceMobile", "ticker": "ASTS", "sector": "..."}}
+
+CSV files need ``ticker``, ``name`` and ``sector`` columns (and optionally a
+``key`` column when the sidebar key differs from the ticker).
+
+Entries may also list ``benchmarks`` (index or sector ETFs, default
+``DEFAULT_BENCHMARKS``) and ``peers`` to compare against; in CSV files these
+are space-separated tickers.
+"""
+import csv
+import json
+import os
+import re
+import threading
+
+DEFAULT_STOCKS_FILE = os.environ.get(
+    "STOCKS_FILE", os.path.join(os.path.dirname(os.path.abspath(__file__)), "stocks.json")
+)
+
+REQUIRED_FIELDS = ("name", "ticker", "sector")
+COMPARISON_FIELDS = ("benchmarks", "peers")
+DEFAULT_BENCHMARKS = ["SPY"]
+# Upstream symbols: letters/digits plus the . - ^ = used by share classes, indices and FX
+TICKER_PATTERN = re.compile(r"[A-Z0-9^][A-Z0-9.\-^=]{0,11}")
+
+
+def _validate(stocks, path):
+    for key, entry in stocks.items():
+        missing = [field for field in REQUIRED_FIELDS if not entry.get(field)]
+        if missing:
+            raise ValueError(f"{path}: entry {key!r} is missing {', '.join(missing)}")
+    return stocks
+
+
+def load_stocks(path=DEFAULT_STOCKS_FILE):
+    """Return the coverage registry as ``{key: {"name", "ticker", "sector"}}``."""
+    if path.lower().endswith(".csv"):
+        with open(path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        stocks = {}
+        for row in rows:
+            row = {k.strip().lower(): (v or "").strip() for k, v in row.items()}
+            key = row.pop("key", "") or row["ticker"]
+            stocks[key] = {field: row.get(field, "") for field in REQUIRED_FIELDS}
+            for field in COMPARISON_FIELDS:
+                if row.get(field):
+                    stocks[key][field] = row[field].split()
+    else:
+        with open(path) as f:
+            stocks = json.load(f)
+    return _validate(stocks, path)
+
+
+def comparison_tickers(entry):
+    """Benchmarks then peers for one registry entry, without the stock itself."""
+    names = list(entry.get("benchmarks", DEFAULT_BENCHMARKS)) + list(entry.get("peers", []))
+    return [name for name in dict.fromkeys(names) if name != entry["ticker"]]
+
+
+def tickers(stocks, comparisons=False):
+    """Unique upstream tickers in registry order; with ``comparisons`` the
+    benchmark and peer tickers follow the covered ones."""
+    names = [entry["ticker"] for entry in stocks.values()]
+    if comparisons:
+        names += [name for entry in stocks.values() for name in comparison_tickers(entry)]
+    return list(dict.fromkeys(names))
+
+
+class AdhocTickers:
+    """Symbols outside the registry that readers typed in. Each costs an
+    upstream fetch and a store file, so only well-formed symbols are admitted
+    and at most ``limit`` distinct ones per process; admitted ones stay
+    admitted."""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self._admitted = set()
+        self._lock = threading.Lock()
+
+    def admit(self, name):
+        if not TICKER_PATTERN.fullmatch(name):
+            return False
+        with self._lock:
+            if name not in self._admitted and len(self._admitted) >= self.limit:
+                return False
+            self._admitted.add(name)
+            return True
+
+    def stats(self):
+        with self._lock:
+            return {"admitted": len(self._admitted), "limit": self.limit}